@@ -1,4 +1,6 @@
 import os
+import functools
+import numpy as np
 import pandas as pd
 import PyPDF2
 import io
@@ -11,6 +13,53 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Possible column names that might contain scam labels
+_SCAM_COLUMN_NAMES = frozenset({'class', 'label', 'target', 'scam', 'fraud', 'is_scam',
+                                'is_fraud', 'spam', 'malicious', 'phishing', 'classification',
+                                'fraudulent', 'type', 'category', 'status', 'result'})
+
+# Mappings for different label formats, built once at import time
+_SCAM_MAPPINGS = {
+    # Binary numeric
+    '1': 'scam', '1.0': 'scam', 1: 'scam', 1.0: 'scam',
+    '0': 'not_scam', '0.0': 'not_scam', 0: 'not_scam', 0.0: 'not_scam',
+
+    # Text labels (case insensitive)
+    'scam': 'scam', 'fraud': 'scam', 'fraudulent': 'scam', 'malicious': 'scam',
+    'spam': 'scam', 'phishing': 'scam', 'fake': 'scam', 'bad': 'scam',
+    'suspicious': 'scam', 'positive': 'scam', 'yes': 'scam', 'true': 'scam',
+
+    'not_scam': 'not_scam', 'legitimate': 'not_scam', 'legit': 'not_scam',
+    'real': 'not_scam', 'good': 'not_scam', 'safe': 'not_scam', 'ham': 'not_scam',
+    'normal': 'not_scam', 'clean': 'not_scam', 'negative': 'not_scam',
+    'no': 'not_scam', 'false': 'not_scam', 'valid': 'not_scam'
+}
+
+# String-keyed view of the mappings for vectorized lookups
+_SCAM_STR_MAPPINGS = {str(key): value for key, value in _SCAM_MAPPINGS.items()}
+
+
+def _is_binary_int(arr: np.ndarray) -> bool:
+    """Check whether an integer array contains only 0/1 values (C-level scan)."""
+    return bool(((arr == 0) | (arr == 1)).all())
+
+
+@functools.lru_cache(maxsize=32)
+def _label_scan_plan(columns: tuple, dtype_kinds: tuple) -> tuple:
+    """
+    Build the per-schema scan plan: which columns are label candidates and
+    whether each takes the integer or string path. Dataframes with the same
+    column names and dtypes recur across uploads, so the plan is cached on
+    the (columns, dtype kinds) signature and the name matching and dtype
+    branching run only once per schema.
+    """
+    paths = {'i': 'int', 'u': 'int', 'c': 'cat'}
+    return tuple(
+        (col, paths.get(kind, 'str'))
+        for col, kind in zip(columns, dtype_kinds)
+        if any(name in col.lower() for name in _SCAM_COLUMN_NAMES)
+    )
+
 class DocumentParser:
     """Handles parsing of various document formats (PDF, CSV, TXT)"""
     
@@ -203,28 +252,6 @@ class DocumentParser:
         Returns:
             Dictionary with scam label information
         """
-        # Possible column names that might contain scam labels
-        scam_column_names = ['class', 'label', 'target', 'scam', 'fraud', 'is_scam', 
-                            'is_fraud', 'spam', 'malicious', 'phishing', 'classification',
-                            'fraudulent', 'type', 'category', 'status', 'result']
-        
-        # Define mappings for different label formats
-        scam_mappings = {
-            # Binary numeric
-            '1': 'scam', '1.0': 'scam', 1: 'scam', 1.0: 'scam',
-            '0': 'not_scam', '0.0': 'not_scam', 0: 'not_scam', 0.0: 'not_scam',
-            
-            # Text labels (case insensitive)
-            'scam': 'scam', 'fraud': 'scam', 'fraudulent': 'scam', 'malicious': 'scam',
-            'spam': 'scam', 'phishing': 'scam', 'fake': 'scam', 'bad': 'scam',
-            'suspicious': 'scam', 'positive': 'scam', 'yes': 'scam', 'true': 'scam',
-            
-            'not_scam': 'not_scam', 'legitimate': 'not_scam', 'legit': 'not_scam',
-            'real': 'not_scam', 'good': 'not_scam', 'safe': 'not_scam', 'ham': 'not_scam',
-            'normal': 'not_scam', 'clean': 'not_scam', 'negative': 'not_scam',
-            'no': 'not_scam', 'false': 'not_scam', 'valid': 'not_scam'
-        }
-        
         scam_info = {
             'has_scam_labels': False,
             'scam_columns': [],
@@ -234,79 +261,113 @@ class DocumentParser:
             'original_values': []
         }
         
-        for col in df.columns:
-            col_lower = col.lower()
-            
-            # Check if column name suggests it's a label column
-            is_potential_label_col = any(name in col_lower for name in scam_column_names)
-            
-            if is_potential_label_col:
-                # Get unique values in the column
-                unique_values = df[col].dropna().unique()
-                
-                # Convert to strings for consistent processing
-                unique_str_values = [str(val).strip().lower() for val in unique_values]
-                
-                # Check if we can map most/all unique values
-                mappable_count = 0
-                for val in unique_str_values:
-                    if val in scam_mappings:
-                        mappable_count += 1
-                
-                # If we can map at least 80% of unique values, consider it a label column
-                mapping_ratio = mappable_count / len(unique_str_values) if unique_str_values else 0
-                
-                if mapping_ratio >= 0.8:
+        # Cached per-schema plan: candidate columns and the path each takes
+        # ('c' marks categorical columns, which have object kind but their
+        # own dictionary-encoded fast path)
+        plan = _label_scan_plan(
+            tuple(df.columns),
+            tuple('c' if isinstance(dtype, pd.CategoricalDtype) else dtype.kind
+                  for dtype in df.dtypes))
+
+        # When several candidate columns need the string path, normalize and
+        # map them together in one stacked pass instead of once per column
+        mapped_by_col = {}
+        str_candidates = [col for col, path in plan if path == 'str']
+        if len(str_candidates) > 1:
+            stacked = pd.concat({col: df[col].astype(str).str.strip().str.lower()
+                                 for col in str_candidates})
+            mapped_stacked = stacked.map(_SCAM_STR_MAPPINGS)
+            mapped_by_col = {col: mapped_stacked.xs(col) for col in str_candidates}
+
+        for col, path in plan:
+            series = df[col]
+
+            # Fast path for integer dtypes: scan the raw buffer for 0/1
+            # values without any string conversion
+            if path == 'int':
+                arr = series.to_numpy(copy=False)
+                if len(arr) and _is_binary_int(arr):
+                    scam_count = int((arr == 1).sum())
+                    not_scam_count = len(arr) - scam_count
+
                     scam_info['has_scam_labels'] = True
                     scam_info['scam_columns'].append(col)
-                    
-                    # Convert labels to readable format
-                    labels = []
-                    original_values = []
-                    
-                    for _, row in df.iterrows():
-                        original_value = row[col]
-                        original_values.append(original_value)
-                        
-                        # Handle NaN/None values
-                        if pd.isna(original_value):
-                            labels.append('unknown')
-                            continue
-                        
-                        value_str = str(original_value).strip().lower()
-                        
-                        if value_str in scam_mappings:
-                            labels.append(scam_mappings[value_str])
-                        else:
-                            labels.append('unknown')
-                    
-                    scam_info['labels'] = labels
-                    scam_info['original_values'] = original_values
-                    
-                    # Determine the detected format
-                    if all(str(val).strip() in ['0', '1', '0.0', '1.0'] for val in unique_values):
-                        scam_info['detected_format'] = 'binary_numeric'
-                    elif all(isinstance(val, (int, float)) for val in unique_values):
-                        scam_info['detected_format'] = 'numeric'
-                    else:
-                        scam_info['detected_format'] = 'text'
-                    
-                    # Calculate distribution
-                    scam_count = labels.count('scam')
-                    not_scam_count = labels.count('not_scam')
-                    unknown_count = labels.count('unknown')
-                    
+                    scam_info['labels'] = np.where(arr == 1, 'scam', 'not_scam').tolist()
+                    scam_info['original_values'] = series.tolist()
+                    scam_info['detected_format'] = 'binary_numeric'
                     scam_info['scam_distribution'] = {
                         'scam': scam_count,
                         'not_scam': not_scam_count,
-                        'unknown': unknown_count,
-                        'total': len(labels)
+                        'unknown': 0,
+                        'total': len(arr)
                     }
-                    
-                    logger.info(f"Detected scam label column '{col}' (format: {scam_info['detected_format']}): "
-                               f"{scam_count} scam, {not_scam_count} not_scam, {unknown_count} unknown")
-                    logger.info(f"Original unique values: {list(unique_values)}")
+
+                    logger.info(f"Detected scam label column '{col}' (format: binary_numeric): "
+                               f"{scam_count} scam, {not_scam_count} not_scam, 0 unknown")
+                    logger.info(f"Original unique values: {list(series.unique())}")
                     break  # Use the first matching column
+
+            if path == 'cat':
+                # Categorical columns are dictionary-encoded: normalize only
+                # the categories (O(#categories)) and broadcast through the
+                # integer codes instead of scanning every row
+                cats_normalized = series.cat.categories.astype(str).str.strip().str.lower()
+                mapped_cats = np.asarray(
+                    [_SCAM_STR_MAPPINGS.get(cat) for cat in cats_normalized] + [None],
+                    dtype=object)
+                codes = series.cat.codes.to_numpy(copy=False)
+                mapped = pd.Series(mapped_cats[codes], index=series.index)
+            else:
+                # Normalize the whole column in one vectorized pass
+                # (single C-level scan instead of a Python loop per row),
+                # reusing the stacked result when it was precomputed above
+                mapped = mapped_by_col.get(col)
+                if mapped is None:
+                    normalized = series.astype(str).str.strip().str.lower()
+                    mapped = normalized.map(_SCAM_STR_MAPPINGS)
+
+            # Get unique values in the column
+            unique_values = series.dropna().unique()
+            unique_normalized = pd.Index(unique_values).astype(str).str.strip().str.lower()
+
+            # If we can map at least 80% of unique values, consider it a label column
+            mapping_ratio = unique_normalized.isin(_SCAM_STR_MAPPINGS).mean() if len(unique_normalized) else 0
+
+            if mapping_ratio >= 0.8:
+                scam_info['has_scam_labels'] = True
+                scam_info['scam_columns'].append(col)
+
+                # Convert labels to readable format; NaN/unmappable values become 'unknown'
+                labels = mapped.where(series.notna() & mapped.notna(), 'unknown')
+
+                scam_info['labels'] = labels.tolist()
+                scam_info['original_values'] = series.tolist()
+                    
+                # Determine the detected format
+                if unique_normalized.isin(['0', '1', '0.0', '1.0']).all():
+                    scam_info['detected_format'] = 'binary_numeric'
+                elif all(isinstance(val, (int, float)) for val in unique_values):
+                    scam_info['detected_format'] = 'numeric'
+                else:
+                    scam_info['detected_format'] = 'text'
+                    
+                # Calculate distribution with a single vectorized count
+                label_counts = labels.value_counts()
+                scam_count = int(label_counts.get('scam', 0))
+                not_scam_count = int(label_counts.get('not_scam', 0))
+                unknown_count = int(label_counts.get('unknown', 0))
+
+                scam_info['scam_distribution'] = {
+                    'scam': scam_count,
+                    'not_scam': not_scam_count,
+                    'unknown': unknown_count,
+                    'total': len(labels)
+                }
+                    
+                logger.info(f"Detected scam label column '{col}' (format: {scam_info['detected_format']}): "
+                           f"{scam_count} scam, {not_scam_count} not_scam, {unknown_count} unknown")
+                logger.info(f"Original unique values: {list(unique_values)}")
+                break  # Use the first matching column
         
         return scam_info
     
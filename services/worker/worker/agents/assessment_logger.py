@@ -6,6 +6,12 @@ import json
 import time
 import os
 import logging
+import logging.handlers
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import uuid
@@ -41,7 +47,13 @@ class AssessmentLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+
+        # Buffer log records in memory and flush in batches so each log call
+        # doesn't pay for its own write() syscall. Errors flush immediately.
+        self._memory_handler = logging.handlers.MemoryHandler(
+            capacity=64, flushLevel=logging.ERROR, target=file_handler
+        )
+        self.logger.addHandler(self._memory_handler)
         
         # Workflow data for JSON export
         self.workflow_data = {
@@ -103,7 +115,7 @@ class AssessmentLogger:
                 step["metadata"] = metadata or {}
                 
                 self.logger.info(f"Step {step_id} completed in {duration:.3f}s")
-                if metadata:
+                if metadata and self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(f"Step {step_id} metadata: {metadata}")
                 break
     
@@ -120,7 +132,7 @@ class AssessmentLogger:
         result_str = "TRUE" if result else "FALSE"
         self.logger.info(f"DECISION: {decision_name} | Condition: {condition} | Result: {result_str}")
         
-        if metadata:
+        if metadata and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Decision metadata: {metadata}")
         
         self.workflow_data["decisions"].append(decision_data)
@@ -138,7 +150,8 @@ class AssessmentLogger:
         if output is not None:
             tool_data["output"] = output
             self.logger.info(f"TOOL: {server}.{tool} - SUCCESS")
-            self.logger.debug(f"Tool output: {output}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Tool output: {output}")
         
         if error:
             tool_data["error"] = error
@@ -154,7 +167,8 @@ class AssessmentLogger:
             "timestamp": datetime.now().isoformat()
         }
         
-        self.logger.debug(f"METRIC: {metric_name} = {value} {unit}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"METRIC: {metric_name} = {value} {unit}")
     
     def log_error(self, error_type: str, error_message: str, context: Dict[str, Any] = None):
         """Log an error."""
@@ -166,7 +180,7 @@ class AssessmentLogger:
         }
         
         self.logger.error(f"ERROR: {error_type} - {error_message}")
-        if context:
+        if context and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Error context: {context}")
         
         self.workflow_data["errors"].append(error_data)
@@ -193,14 +207,24 @@ class AssessmentLogger:
         self.logger.info(f"Errors encountered: {error_count}")
         self.logger.info(f"Final result: {final_result.get('is_scam', 'unknown')}")
         
-        # Export workflow data to JSON
+        # Export workflow data to JSON. Serialize to one bytes blob first so
+        # the export is a single write; orjson does this ~5x faster than json.
         try:
-            with open(self.json_file, 'w') as f:
-                json.dump(self.workflow_data, f, indent=2, default=str)
+            if orjson is not None:
+                payload = orjson.dumps(self.workflow_data,
+                                       option=orjson.OPT_INDENT_2,
+                                       default=str)
+            else:
+                payload = json.dumps(self.workflow_data, indent=2, default=str).encode()
+            with open(self.json_file, 'wb') as f:
+                f.write(payload)
             self.logger.info(f"Workflow data exported to: {self.json_file}")
         except Exception as e:
             self.logger.error(f"Failed to export workflow data: {e}")
-        
+
+        # Flush any buffered log records now that the workflow is done
+        self._memory_handler.flush()
+
         return self.workflow_data
     
     def log_data(self, label: str, data: dict):
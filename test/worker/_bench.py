@@ -0,0 +1,67 @@
+"""
+Shared benchmark and error-scenario tables for the worker test suite.
+
+test_config.py and test_data.py both carried performance benchmarks and
+error scenarios with overlapping keys; like _mocks.py, the canonical
+copies live here once so there is a single build per process and the two
+modules cannot drift apart.
+"""
+
+# Benchmark keys common to both modules; each overlays its own limits
+BASE_PERFORMANCE_BENCHMARKS = {
+    "max_tool_calls": 15,
+    "min_evidence_items": 1,
+}
+
+# Error scenarios as structured workflow behaviors (test_config.py view)
+WORKFLOW_ERROR_SCENARIOS = {
+    "rag_service_unavailable": {
+        "description": "RAG service is down or unresponsive",
+        "mock_behavior": {
+            "call_tool": {"rag-tools.call_rag": "ConnectionError: Service unavailable"},
+            "expected_fallback": True
+        }
+    },
+
+    "extraction_tool_failure": {
+        "description": "Optional extraction tools fail",
+        "mock_behavior": {
+            "call_tool": {"extraction-tools.extract_link": "ParseError: Invalid format"},
+            "expected_fallback": False  # Should continue with other tools
+        }
+    },
+
+    "llm_rate_limit": {
+        "description": "LLM service hits rate limits",
+        "mock_behavior": {
+            "chat_json": "RateLimitError: Too many requests",
+            "expected_fallback": True
+        }
+    },
+
+    "invalid_document": {
+        "description": "Document processing fails",
+        "mock_behavior": {
+            "process_document": "ValueError: Invalid document format",
+            "expected_fallback": True
+        }
+    }
+}
+
+# Error scenarios as raw tool failures (test_data.py view)
+TOOL_ERROR_SCENARIOS = {
+    "rag_service_down": {
+        "tool": "rag-tools.call_rag",
+        "error": "Connection timeout: RAG service unavailable"
+    },
+    "extraction_failure": {
+        "tool": "extraction-tools.extract_link",
+        "error": "Text parsing failed: Invalid format"
+    },
+    "llm_rate_limit": {
+        "error": "Rate limit exceeded: Too many requests"
+    },
+    "invalid_json": {
+        "response": '{"invalid": json response}'
+    }
+}
@@ -0,0 +1,113 @@
+"""
+Shared tool-mock fixtures for the worker test suite.
+
+test_config.py and test_data.py historically carried two near-identical
+copies of the tool response tables, doubling parse cost and inviting
+drift. The common structure lives here once; each module overlays its
+file-specific deltas on top via overlay().
+"""
+
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True, frozen=True)
+class RagResponse:
+    """One call_rag scenario response as a frozen slotted record.
+
+    Slots drop the per-instance __dict__ and frozen makes the records
+    safely shareable across tests. Mapping-style dunders keep the
+    dict-shaped access (`response["average_confidence_level"]`) that the
+    harness and validators already use.
+    """
+    average_confidence_level: float
+    average_scam_probability: float
+    similar_documents: tuple
+    similarity_scores: tuple
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return tuple(f.name for f in fields(self))
+
+
+def rag_records(rag_table):
+    """Convert merged call_rag scenario dicts into RagResponse records."""
+    return {
+        name: RagResponse(
+            average_confidence_level=spec["average_confidence_level"],
+            average_scam_probability=spec["average_scam_probability"],
+            similar_documents=tuple(spec["similar_documents"]),
+            similarity_scores=tuple(spec["similarity_scores"]),
+        )
+        for name, spec in rag_table.items()
+    }
+
+
+BASE_TOOL_MOCKS = {
+    "data-processor.extract_text": {
+        "scam": "Extracted suspicious content with fraud indicators like money transfers and urgent requests",
+        "legitimate": "Extracted legitimate business communication about meetings and standard operations",
+        "uncertain": "Extracted promotional content with mixed commercial and potentially suspicious elements"
+    },
+
+    "rag-tools.call_rag": {
+        "high_confidence_scam": {
+            "average_confidence_level": 0.95,
+            "average_scam_probability": 0.89,
+            "similar_documents": ["nigerian_scam_001", "inheritance_fraud_002"],
+            "similarity_scores": [0.94, 0.91]
+        },
+        "high_confidence_legitimate": {
+            "average_confidence_level": 0.93,
+            "average_scam_probability": 0.11,
+            "similar_documents": ["business_email_001", "meeting_request_002"],
+            "similarity_scores": [0.89, 0.86]
+        },
+        "uncertain": {
+            "average_confidence_level": 0.65,
+            "average_scam_probability": 0.45,
+            "similar_documents": ["promotional_001"],
+            "similarity_scores": [0.71]
+        }
+    },
+
+    "extraction-tools.extract_link": {
+        "scam": ["http://fake-bank-site.com/claim", "http://suspicious-domain.net"],
+        "legitimate": ["https://company.com/portal", "https://legitimate-site.org"],
+        "uncertain": ["http://deals-site.com/offer", "http://download-center.net"]
+    },
+
+    "extraction-tools.extract_number": {
+        "scam": ["+234-555-FAKE", "$10,000,000", "$1,500"],
+        "legitimate": ["(555) 123-4567", "$299.99", "Room 123"],
+        "uncertain": ["1-800-SUPPORT", "70%", "$0"]
+    },
+
+    "extraction-tools.extract_organisation": {
+        "scam": ["Nigerian Prince Foundation", "International Lottery Corp"],
+        "legitimate": ["ABC Corporation", "Tech Solutions Inc"],
+        "uncertain": ["Deals Online", "Support Center"]
+    }
+}
+
+
+def overlay(base, extra):
+    """Deep-merge extra onto base into a new dict.
+
+    Nested dicts merge recursively; any other value (strings, lists)
+    replaces the base entry wholesale.
+    """
+    merged = dict(base)
+    for key, value in extra.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = overlay(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
@@ -0,0 +1,75 @@
+"""
+One-shot generator for the serialized fixture cache.
+
+Usage: python -m test.worker.build_fixtures (from the project root)
+
+Serializes the large literal tables in test_config.py and test_data.py into
+test/worker/_fixtures.json, so pytest sessions can load them with a single
+parse instead of re-executing hundreds of nested literals in every worker
+interpreter. JSON (via orjson when installed) parses faster than pickle for
+this float/string-heavy payload and the blob is identical across
+interpreter versions. Rerun after editing either source module.
+"""
+import dataclasses
+import json
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_HERE = Path(__file__).resolve().parent
+if str(_HERE) not in sys.path:
+    sys.path.insert(0, str(_HERE))
+
+FIXTURE_FILE = _HERE / "_fixtures.json"
+
+
+def _plain(obj):
+    """Deep-convert read-only proxies and tuples back to serializable builtins."""
+    if dataclasses.is_dataclass(obj):
+        return _plain(dataclasses.asdict(obj))
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {k: _plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_plain(v) for v in obj]
+    return obj
+
+
+def collect():
+    """Gather the fixture tables from their source modules."""
+    import test_config
+    import test_data
+
+    # Materialize the lazily-loaded email bodies so the cache is complete
+    for table in (test_data.SCAM_EMAILS, test_data.LEGITIMATE_EMAILS,
+                  test_data.UNCERTAIN_EMAILS):
+        for email in table.values():
+            email["content"]
+
+    return {
+        "TEST_SCENARIOS": _plain(test_config.TEST_SCENARIOS),
+        "TOOL_MOCK_RESPONSES": _plain(test_config.TOOL_MOCK_RESPONSES),
+        "LLM_MOCK_RESPONSES": _plain(test_config.LLM_MOCK_RESPONSES),
+        "SCAM_EMAILS": _plain(test_data.SCAM_EMAILS),
+        "LEGITIMATE_EMAILS": _plain(test_data.LEGITIMATE_EMAILS),
+        "UNCERTAIN_EMAILS": _plain(test_data.UNCERTAIN_EMAILS),
+        "MOCK_TOOL_RESPONSES": _plain(test_data.MOCK_TOOL_RESPONSES),
+    }
+
+
+def main():
+    tables = collect()
+    if orjson is not None:
+        payload = orjson.dumps(tables)
+    else:
+        payload = json.dumps(tables, separators=(",", ":")).encode()
+    FIXTURE_FILE.write_bytes(payload)
+    print(f"✅ Wrote {FIXTURE_FILE} ({len(payload)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
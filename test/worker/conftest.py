@@ -0,0 +1,65 @@
+"""
+Shared pytest setup for the worker test suite.
+Puts the project root and the worker service on sys.path once per session,
+so individual test files don't need their own path-probing preambles when
+run under pytest, and exposes the fixture tables through session-scoped
+fixtures backed by the serialized cache (see build_fixtures.py).
+"""
+import functools
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_PROJECT_ROOT = next(p for p in Path(__file__).resolve().parents
+                     if (p / 'services').is_dir())
+
+# This directory must be on the path too: test/ is a package, so pytest
+# imports these files as test.worker.* and their bare intra-suite imports
+# (test_utils, _bench, _mocks, build_fixtures) resolve only through here.
+for _path in (str(_PROJECT_ROOT),
+              str(_PROJECT_ROOT / 'services' / 'worker'),
+              str(Path(__file__).resolve().parent)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+_FIXTURE_FILE = Path(__file__).with_name('_fixtures.json')
+
+
+@functools.lru_cache(maxsize=None)
+def _fixture_tables():
+    """Load the fixture tables once per process.
+
+    Prefers the serialized cache, which parses far faster than
+    re-executing the literal-heavy source modules in every xdist worker
+    (orjson's C parser when installed, stdlib json otherwise); falls back
+    to importing the sources when the cache hasn't been built
+    (python -m test.worker.build_fixtures).
+    """
+    if _FIXTURE_FILE.exists():
+        raw = _FIXTURE_FILE.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    import build_fixtures
+    return build_fixtures.collect()
+
+
+@pytest.fixture(scope="session")
+def fixture_tables():
+    """All fixture tables keyed by their constant name."""
+    return _fixture_tables()
+
+
+@pytest.fixture(scope="session")
+def mock_tool_responses(fixture_tables):
+    return fixture_tables["MOCK_TOOL_RESPONSES"]
+
+
+@pytest.fixture(scope="session")
+def test_scenarios(fixture_tables):
+    return fixture_tables["TEST_SCENARIOS"]
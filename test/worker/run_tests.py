@@ -2,18 +2,28 @@
 Simplified test runner for assess_document workflow.
 Can be run without pytest - uses standard Python testing.
 """
+import functools
 import sys
 import os
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import replace
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add the worker path to sys.path
-sys.path.insert(0, '/Users/chenxiangrui/Projects/SentinelAI/services/worker')
+# Make the worker package importable; computed from this file's location
+# rather than a hard-coded developer checkout path, and guarded so reruns
+# don't stack duplicate sys.path entries
+_WORKER_PATH = str(Path(__file__).resolve().parents[2] / 'services' / 'worker')
+if _WORKER_PATH not in sys.path:
+    sys.path.insert(0, _WORKER_PATH)
 
 # Import test utilities and data
 from test_utils import (
     setup_test_environment, 
+    MockResult,
     create_mock_dependencies,
     setup_scam_detection_mocks,
     setup_error_scenario_mocks,
@@ -23,7 +33,389 @@ from test_utils import (
     create_test_document,
     cleanup_test_files
 )
-from test_data import SCAM_EMAILS, LEGITIMATE_EMAILS, UNCERTAIN_EMAILS, PERFORMANCE_BENCHMARKS
+
+@functools.cache
+def _email_fixtures():
+    """Load the multi-kilobyte email fixture tables on first use.
+
+    Only the real-execution paths read them; importing test_data eagerly
+    would make every worker process pay the fixture cost at startup even
+    for tests (logging, error handling) that never touch an email.
+    """
+    from test_data import SCAM_EMAILS, LEGITIMATE_EMAILS, UNCERTAIN_EMAILS
+    return {
+        "scam": SCAM_EMAILS,
+        "legitimate": LEGITIMATE_EMAILS,
+        "uncertain": UNCERTAIN_EMAILS
+    }
+
+
+# Resolve the orchestrator import once at module scope. Each test previously
+# re-ran the same try/import in its body, invoking the import machinery (and
+# the ImportError path when dependencies are missing) six times per run.
+try:
+    from worker.agents.orchestrator import assess_document
+    _HAS_ASSESS = True
+except ImportError:
+    assess_document = None
+    _HAS_ASSESS = False
+
+# Patch targets shared by every real-execution test
+_BASE_PATCH_TARGETS = (
+    ('worker.agents.orchestrator.call_tool', 'call_tool'),
+    ('worker.tools.selector.process_document', 'process_document'),
+    ('worker.tools.selector.choose_tools', 'choose_tools'),
+)
+
+
+@contextmanager
+def patched_orchestrator(mocks, extra=()):
+    """Install the shared orchestrator/selector patches in one stack.
+
+    Each test used to spell out the same 3-4 level nested `with patch(...)`
+    block; building them through one ExitStack keeps a single start/stop
+    cycle and lets scenario-specific seams ride along as (target, mock_key)
+    pairs in `extra`.
+    """
+    with ExitStack() as stack:
+        for target, key in _BASE_PATCH_TARGETS + tuple(extra):
+            stack.enter_context(patch(target, mocks[key]))
+        yield mocks
+
+# The three detection-scenario tests share one body; each entry carries the
+# bits that differ: input email, validation key, scenario-specific patch,
+# and the simulated result used when the orchestrator is not importable
+_SCENARIOS = {
+    "high_confidence_scam": {
+        "email": ("scam", "nigerian_prince"),
+        "expected": "high_confidence_scam",
+        "extra_patches": [('worker.tools.selector.scam_executer', 'scam_executer')],
+        "simulated": MockResult(
+            is_scam="scam",
+            confidence_level=0.95,
+            scam_probability=89.0,
+            explanation="High confidence fraud detection based on similar documents",
+            processing_metadata={
+                "workflow_id": "test123",
+                "total_time": 1.23,
+                "evidence_gathered": 2,
+                "errors_encountered": 0
+            }
+        ),
+        "simulated_notes": [
+            "   ✓ Mock result structure is valid",
+            "   ✓ High confidence scam logic verified"
+        ]
+    },
+    "high_confidence_legitimate": {
+        "email": ("legitimate", "business_meeting"),
+        "expected": "high_confidence_legitimate",
+        "extra_patches": [('worker.tools.selector.not_scam_executer', 'not_scam_executer')],
+        "simulated": MockResult(
+            is_scam="not_scam",
+            confidence_level=0.93,
+            scam_probability=11.0,
+            explanation="High confidence legitimate detection",
+            processing_metadata={
+                "workflow_id": "test456",
+                "total_time": 0.89,
+                "evidence_gathered": 2,
+                "errors_encountered": 0
+            }
+        ),
+        "simulated_notes": ["   ✓ Mock legitimate result structure is valid"]
+    },
+    "uncertain_case": {
+        "email": ("uncertain", "promotional"),
+        "expected": "any",
+        "extra_patches": [('worker.agents.orchestrator._chat_json', 'chat_json')],
+        "check_evidence": True,
+        "simulated": MockResult(
+            is_scam="suspicious",
+            confidence_level=0.7,
+            scam_probability=65.0,
+            explanation="Mixed indicators detected",
+            tool_evidence=[
+                {"tool": "data-processor.extract_text", "output": "Mixed content"},
+                {"tool": "rag-tools.call_rag", "output": {"confidence": 0.65}},
+                {"tool": "extraction-tools.extract_link", "output": ["http://example.com"]}
+            ],
+            processing_metadata={
+                "workflow_id": "test789",
+                "total_time": 2.45,
+                "evidence_gathered": 3,
+                "errors_encountered": 0
+            }
+        ),
+        "simulated_notes": [
+            "   ✓ Mock uncertain result structure is valid",
+            "   ✓ Tool evidence properly structured"
+        ]
+    }
+}
+
+
+def _run_scenario(scenario):
+    """Shared body for the detection-scenario tests."""
+    spec = _SCENARIOS[scenario]
+
+    if not _HAS_ASSESS:
+        print("⚠️  Could not import assess_document - skipping actual execution")
+        print("   This test validates the mocking and structure only")
+
+        # Simulate what the assessment would return
+        mock_result = replace(
+            spec["simulated"],
+            processing_metadata={
+                **spec["simulated"].processing_metadata,
+                "timestamp": time.time()
+            }
+        )
+
+        errors = validate_assessment_result(mock_result, spec["expected"])
+        if errors:
+            raise AssertionError(f"Result validation failed: {errors}")
+
+        for note in spec["simulated_notes"]:
+            print(note)
+        return
+
+    mocks = create_mock_dependencies()
+    setup_scam_detection_mocks(mocks, scenario)
+
+    with patched_orchestrator(mocks, spec["extra_patches"]):
+        table, key = spec["email"]
+        result = assess_document(_email_fixtures()[table][key])
+
+    errors = validate_assessment_result(result, spec["expected"])
+    if errors:
+        raise AssertionError(f"Assessment validation failed: {errors}")
+
+    # Check that full analysis was performed when the scenario requires it
+    if spec.get("check_evidence") and "tool_evidence" not in result:
+        raise AssertionError(f"Expected tool_evidence for {scenario}")
+
+    print(f"   ✓ Detected as: {result['is_scam']}")
+    print(f"   ✓ Confidence: {result['confidence_level']}")
+    print(f"   ✓ Scam probability: {result['scam_probability']}")
+    if spec.get("check_evidence"):
+        print(f"   ✓ Evidence items: {len(result.get('tool_evidence', []))}")
+
+
+def test_high_confidence_scam_detection():
+    """Test fast path for high confidence scam detection."""
+    _run_scenario("high_confidence_scam")
+
+def test_high_confidence_legitimate_detection():
+    """Test fast path for high confidence legitimate detection."""
+    _run_scenario("high_confidence_legitimate")
+
+def test_uncertain_case_full_analysis():
+    """Test full LLM analysis path for uncertain cases."""
+    _run_scenario("uncertain_case")
+
+def test_error_handling():
+    """Test error handling and fallback behavior."""
+    if not _HAS_ASSESS:
+        print("⚠️  Could not import assess_document - skipping actual execution")
+        
+        # Simulate error handling
+        mock_result = MockResult(
+            is_scam="suspicious",
+            confidence_level=0.6,
+            scam_probability=50.0,
+            explanation="Fallback assessment due to errors",
+            tool_errors=[
+                {"tool": "rag-tools.call_rag", "error": "Service unavailable"}
+            ],
+            processing_metadata={
+                "workflow_id": "test_error",
+                "total_time": 1.0,
+                "evidence_gathered": 1,
+                "errors_encountered": 1,
+                "timestamp": time.time()
+            }
+        )
+        
+        errors = validate_assessment_result(mock_result)
+        if errors:
+            raise AssertionError(f"Result validation failed: {errors}")
+        
+        print("   ✓ Error handling structure is valid")
+        return
+    
+    mocks = create_mock_dependencies()
+    setup_error_scenario_mocks(mocks, "rag_failure")
+    
+    with patched_orchestrator(mocks):
+
+        result = assess_document({"content": "test document"})
+        
+        # Should handle errors gracefully
+        errors = validate_assessment_result(result)
+        if errors:
+            raise AssertionError(f"Assessment validation failed: {errors}")
+        
+        # Check error handling
+        if "tool_errors" not in result:
+            print("   ⚠️  No tool_errors in result (may be expected)")
+        else:
+            print(f"   ✓ Errors handled: {len(result['tool_errors'])}")
+
+def test_logging_system():
+    """Test that logging system works properly."""
+    if not _HAS_ASSESS:
+        print("⚠️  Could not import assess_document - testing log structure only")
+        
+        # Create mock log files to test structure
+        test_dir = "test/worker"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        
+        # Create a sample log file; serialize each artefact to one blob and
+        # write it with a single call rather than one write per line
+        log_file = f"{test_dir}/assessment_{timestamp}_test.log"
+        log_blob = "\n".join([
+            "2025-09-04 12:00:00 | INFO | === WORKFLOW START ===",
+            "2025-09-04 12:00:01 | INFO | Step 1: document_processing",
+            "2025-09-04 12:00:02 | INFO | Step 1 completed in 1.000s",
+            ""
+        ]).encode()
+        with open(log_file, 'wb') as f:
+            f.write(log_blob)
+
+        # Create a sample JSON file
+        json_file = f"{test_dir}/assessment_{timestamp}_test.json"
+        sample_data = {
+            "workflow_id": "test123",
+            "start_time": time.time(),
+            "steps": [{"step_id": 1, "step_name": "document_processing"}],
+            "final_result": {"is_scam": "not_scam"}
+        }
+        with open(json_file, 'wb') as f:
+            f.write(json.dumps(sample_data, indent=2).encode())
+        
+        print("   ✓ Log file structure created and validated")
+        return
+    
+    # Count existing log files
+    log_check_before = check_log_files_created()
+    
+    # Run a simple assessment to generate logs
+    mocks = create_mock_dependencies()
+    setup_scam_detection_mocks(mocks, "high_confidence_legitimate")
+    
+    with patched_orchestrator(mocks):
+
+        result = assess_document({"content": "test"})
+    
+    # Check that logs were created
+    log_check_after = check_log_files_created()
+    
+    if not log_check_after["log_file_created"]:
+        raise AssertionError("Log file was not created")
+    
+    if not log_check_after["json_file_created"]:
+        raise AssertionError("JSON file was not created")
+    
+    print("   ✓ Log files created successfully")
+    print("   ✓ JSON workflow data exported")
+
+def test_performance_benchmarks():
+    """Test performance against benchmarks."""
+    # Only this test reads the benchmark table, so the import stays local
+    from test_data import PERFORMANCE_BENCHMARKS
+
+    if not _HAS_ASSESS:
+        print("⚠️  Could not import assess_document - skipping performance test")
+        print("   Expected benchmarks:")
+        for metric, value in PERFORMANCE_BENCHMARKS.items():
+            print(f"     {metric}: {value}")
+        return
+    
+    mocks = create_mock_dependencies()
+    setup_scam_detection_mocks(mocks, "high_confidence_scam")
+    
+    def run_assessment():
+        with patched_orchestrator(mocks):
+            return assess_document({"content": "test"})
+    
+    # Measure performance; the mocked assessment is cheap enough to repeat,
+    # so take the median of several rounds instead of one noisy sample
+    perf_data = measure_performance(run_assessment, rounds=5)
+    
+    # Check against benchmarks
+    if perf_data.execution_time > PERFORMANCE_BENCHMARKS["max_processing_time"]:
+        print(f"   ⚠️  Execution time ({perf_data.execution_time:.2f}s) exceeds benchmark ({PERFORMANCE_BENCHMARKS['max_processing_time']}s)")
+    else:
+        print(f"   ✓ Execution time: {perf_data.execution_time:.2f}s (within benchmark)")
+    
+    if perf_data.success:
+        result = perf_data.result
+        evidence_count = len(result.get("tool_evidence", []))
+        print(f"   ✓ Evidence items: {evidence_count}")
+        
+        if "processing_metadata" in result:
+            metadata = result["processing_metadata"]
+            for field in PERFORMANCE_BENCHMARKS["required_metadata_fields"]:
+                if field in metadata:
+                    print(f"   ✓ Metadata field present: {field}")
+                else:
+                    raise AssertionError(f"Missing required metadata field: {field}")
+    else:
+        raise AssertionError(f"Performance test failed: {perf_data.error}")
+
+
+# All tests, as picklable module-level functions so they can be shipped to
+# worker processes
+ALL_TESTS = [
+    ("High Confidence Scam Detection", test_high_confidence_scam_detection),
+    ("High Confidence Legitimate Detection", test_high_confidence_legitimate_detection),
+    ("Uncertain Case Full Analysis", test_uncertain_case_full_analysis),
+    ("Error Handling", test_error_handling),
+    ("Logging System", test_logging_system),
+    ("Performance Benchmarks", test_performance_benchmarks)
+]
+
+
+def _run_one(named_test):
+    """Run a single test and return its result record."""
+    test_name, test_func = named_test
+
+    print(f"\n{'='*60}")
+    print(f"Running: {test_name}")
+    print('='*60)
+
+    # Monotonic integer clock: nanosecond resolution, no wall-clock jumps
+    start_ns = time.perf_counter_ns()
+
+    # Assertion failures are expected test outcomes; anything else is an
+    # unexpected error and gets flagged as such. BaseException (Ctrl-C)
+    # propagates rather than being recorded as a failure.
+    try:
+        test_func()
+        status = "PASSED"
+        exc = None
+        print(f"✅ {test_name} - PASSED")
+    except AssertionError as e:
+        status = "FAILED"
+        exc = e
+        print(f"❌ {test_name} - FAILED: {e}")
+    except Exception as e:
+        status = "ERROR"
+        exc = e
+        print(f"❌ {test_name} - ERROR: {e!r}")
+
+    dur_ns = time.perf_counter_ns() - start_ns
+
+    # Stringify before returning: the record crosses the process boundary
+    # and exception objects don't reliably pickle
+    return {
+        "test_name": test_name,
+        "status": status,
+        "duration_ns": dur_ns,
+        "error": None if exc is None else str(exc)
+    }
+
 
 class SimpleTestRunner:
     """Simple test runner that doesn't require pytest."""
@@ -39,367 +431,33 @@ class SimpleTestRunner:
     
     def run_test(self, test_name: str, test_func):
         """Run a single test and capture results."""
-        print(f"\n{'='*60}")
-        print(f"Running: {test_name}")
-        print('='*60)
-        
-        start_time = time.time()
-        
-        try:
-            test_func()
-            status = "PASSED"
-            error = None
+        self._record(_run_one((test_name, test_func)))
+
+    def _record(self, result):
+        """Fold one test result into the runner's counters."""
+        if result["status"] == "PASSED":
             self.tests_passed += 1
-            print(f"✅ {test_name} - PASSED")
-        except Exception as e:
-            status = "FAILED"
-            error = str(e)
+        else:
             self.tests_failed += 1
-            print(f"❌ {test_name} - FAILED: {error}")
-        
-        end_time = time.time()
-        
-        self.test_results.append({
-            "test_name": test_name,
-            "status": status,
-            "duration": end_time - start_time,
-            "error": error
-        })
-        
+        self.test_results.append(result)
         self.tests_run += 1
-    
-    def test_high_confidence_scam_detection(self):
-        """Test fast path for high confidence scam detection."""
-        # Import here to avoid import issues
-        try:
-            from worker.agents.orchestrator import assess_document
-        except ImportError:
-            print("⚠️  Could not import assess_document - skipping actual execution")
-            print("   This test validates the mocking and structure only")
-            
-            # Simulate what the assessment would return
-            mock_result = {
-                "is_scam": "scam",
-                "confidence_level": 0.95,
-                "scam_probability": 89.0,
-                "explanation": "High confidence fraud detection based on similar documents",
-                "processing_metadata": {
-                    "workflow_id": "test123",
-                    "total_time": 1.23,
-                    "evidence_gathered": 2,
-                    "errors_encountered": 0,
-                    "timestamp": time.time()
-                }
-            }
-            
-            # Validate structure
-            errors = validate_assessment_result(mock_result, "high_confidence_scam")
-            if errors:
-                raise AssertionError(f"Result validation failed: {errors}")
-            
-            print("   ✓ Mock result structure is valid")
-            print("   ✓ High confidence scam logic verified")
-            return
-        
-        # If import succeeds, run actual test with mocks
-        mocks = create_mock_dependencies()
-        setup_scam_detection_mocks(mocks, "high_confidence_scam")
-        
-        with patch('worker.agents.orchestrator.call_tool', mocks['call_tool']), \
-             patch('worker.tools.selector.process_document', mocks['process_document']), \
-             patch('worker.tools.selector.choose_tools', mocks['choose_tools']), \
-             patch('worker.tools.selector.scam_executer', mocks['scam_executer']):
-            
-            result = assess_document(SCAM_EMAILS["nigerian_prince"])
-            
-            # Validate result
-            errors = validate_assessment_result(result, "high_confidence_scam")
-            if errors:
-                raise AssertionError(f"Assessment validation failed: {errors}")
-            
-            print(f"   ✓ Detected as: {result['is_scam']}")
-            print(f"   ✓ Confidence: {result['confidence_level']}")
-            print(f"   ✓ Scam probability: {result['scam_probability']}")
-    
-    def test_high_confidence_legitimate_detection(self):
-        """Test fast path for high confidence legitimate detection."""
-        try:
-            from worker.agents.orchestrator import assess_document
-        except ImportError:
-            print("⚠️  Could not import assess_document - skipping actual execution")
-            
-            # Simulate legitimate detection
-            mock_result = {
-                "is_scam": "not_scam",
-                "confidence_level": 0.93,
-                "scam_probability": 11.0,
-                "explanation": "High confidence legitimate detection",
-                "processing_metadata": {
-                    "workflow_id": "test456",
-                    "total_time": 0.89,
-                    "evidence_gathered": 2,
-                    "errors_encountered": 0,
-                    "timestamp": time.time()
-                }
-            }
-            
-            errors = validate_assessment_result(mock_result, "high_confidence_legitimate")
-            if errors:
-                raise AssertionError(f"Result validation failed: {errors}")
-            
-            print("   ✓ Mock legitimate result structure is valid")
-            return
-        
-        mocks = create_mock_dependencies()
-        setup_scam_detection_mocks(mocks, "high_confidence_legitimate")
-        
-        with patch('worker.agents.orchestrator.call_tool', mocks['call_tool']), \
-             patch('worker.tools.selector.process_document', mocks['process_document']), \
-             patch('worker.tools.selector.choose_tools', mocks['choose_tools']), \
-             patch('worker.tools.selector.not_scam_executer', mocks['not_scam_executer']):
-            
-            result = assess_document(LEGITIMATE_EMAILS["business_meeting"])
-            
-            errors = validate_assessment_result(result, "high_confidence_legitimate")
-            if errors:
-                raise AssertionError(f"Assessment validation failed: {errors}")
-            
-            print(f"   ✓ Detected as: {result['is_scam']}")
-            print(f"   ✓ Confidence: {result['confidence_level']}")
-            print(f"   ✓ Scam probability: {result['scam_probability']}")
-    
-    def test_uncertain_case_full_analysis(self):
-        """Test full LLM analysis path for uncertain cases."""
-        try:
-            from worker.agents.orchestrator import assess_document
-        except ImportError:
-            print("⚠️  Could not import assess_document - skipping actual execution")
-            
-            # Simulate uncertain case
-            mock_result = {
-                "is_scam": "suspicious",
-                "confidence_level": 0.7,
-                "scam_probability": 65.0,
-                "explanation": "Mixed indicators detected",
-                "tool_evidence": [
-                    {"tool": "data-processor.extract_text", "output": "Mixed content"},
-                    {"tool": "rag-tools.call_rag", "output": {"confidence": 0.65}},
-                    {"tool": "extraction-tools.extract_link", "output": ["http://example.com"]}
-                ],
-                "processing_metadata": {
-                    "workflow_id": "test789",
-                    "total_time": 2.45,
-                    "evidence_gathered": 3,
-                    "errors_encountered": 0,
-                    "timestamp": time.time()
-                }
-            }
-            
-            errors = validate_assessment_result(mock_result)
-            if errors:
-                raise AssertionError(f"Result validation failed: {errors}")
-            
-            print("   ✓ Mock uncertain result structure is valid")
-            print("   ✓ Tool evidence properly structured")
-            return
-        
-        mocks = create_mock_dependencies()
-        setup_scam_detection_mocks(mocks, "uncertain_case")
-        
-        with patch('worker.agents.orchestrator.call_tool', mocks['call_tool']), \
-             patch('worker.agents.orchestrator._chat_json', mocks['chat_json']), \
-             patch('worker.tools.selector.process_document', mocks['process_document']), \
-             patch('worker.tools.selector.choose_tools', mocks['choose_tools']):
-            
-            result = assess_document(UNCERTAIN_EMAILS["promotional"])
-            
-            errors = validate_assessment_result(result)
-            if errors:
-                raise AssertionError(f"Assessment validation failed: {errors}")
-            
-            # Check that full analysis was performed
-            if "tool_evidence" not in result:
-                raise AssertionError("Expected tool_evidence for uncertain case")
-            
-            print(f"   ✓ Detected as: {result['is_scam']}")
-            print(f"   ✓ Evidence items: {len(result.get('tool_evidence', []))}")
-    
-    def test_error_handling(self):
-        """Test error handling and fallback behavior."""
-        try:
-            from worker.agents.orchestrator import assess_document
-        except ImportError:
-            print("⚠️  Could not import assess_document - skipping actual execution")
-            
-            # Simulate error handling
-            mock_result = {
-                "is_scam": "suspicious",
-                "confidence_level": 0.6,
-                "scam_probability": 50.0,
-                "explanation": "Fallback assessment due to errors",
-                "tool_errors": [
-                    {"tool": "rag-tools.call_rag", "error": "Service unavailable"}
-                ],
-                "processing_metadata": {
-                    "workflow_id": "test_error",
-                    "total_time": 1.0,
-                    "evidence_gathered": 1,
-                    "errors_encountered": 1,
-                    "timestamp": time.time()
-                }
-            }
-            
-            errors = validate_assessment_result(mock_result)
-            if errors:
-                raise AssertionError(f"Result validation failed: {errors}")
-            
-            print("   ✓ Error handling structure is valid")
-            return
-        
-        mocks = create_mock_dependencies()
-        setup_error_scenario_mocks(mocks, "rag_failure")
-        
-        with patch('worker.agents.orchestrator.call_tool', mocks['call_tool']), \
-             patch('worker.tools.selector.process_document', mocks['process_document']), \
-             patch('worker.tools.selector.choose_tools', mocks['choose_tools']):
-            
-            result = assess_document({"content": "test document"})
-            
-            # Should handle errors gracefully
-            errors = validate_assessment_result(result)
-            if errors:
-                raise AssertionError(f"Assessment validation failed: {errors}")
-            
-            # Check error handling
-            if "tool_errors" not in result:
-                print("   ⚠️  No tool_errors in result (may be expected)")
-            else:
-                print(f"   ✓ Errors handled: {len(result['tool_errors'])}")
-    
-    def test_logging_system(self):
-        """Test that logging system works properly."""
-        try:
-            from worker.agents.orchestrator import assess_document
-        except ImportError:
-            print("⚠️  Could not import assess_document - testing log structure only")
-            
-            # Create mock log files to test structure
-            test_dir = "test/worker"
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            
-            # Create a sample log file
-            log_file = f"{test_dir}/assessment_{timestamp}_test.log"
-            with open(log_file, 'w') as f:
-                f.write("2025-09-04 12:00:00 | INFO | === WORKFLOW START ===\n")
-                f.write("2025-09-04 12:00:01 | INFO | Step 1: document_processing\n")
-                f.write("2025-09-04 12:00:02 | INFO | Step 1 completed in 1.000s\n")
-            
-            # Create a sample JSON file
-            json_file = f"{test_dir}/assessment_{timestamp}_test.json"
-            sample_data = {
-                "workflow_id": "test123",
-                "start_time": time.time(),
-                "steps": [{"step_id": 1, "step_name": "document_processing"}],
-                "final_result": {"is_scam": "not_scam"}
-            }
-            with open(json_file, 'w') as f:
-                json.dump(sample_data, f, indent=2)
-            
-            print("   ✓ Log file structure created and validated")
-            return
-        
-        # Count existing log files
-        log_check_before = check_log_files_created()
-        
-        # Run a simple assessment to generate logs
-        mocks = create_mock_dependencies()
-        setup_scam_detection_mocks(mocks, "high_confidence_legitimate")
-        
-        with patch('worker.agents.orchestrator.call_tool', mocks['call_tool']), \
-             patch('worker.tools.selector.process_document', mocks['process_document']), \
-             patch('worker.tools.selector.choose_tools', mocks['choose_tools']):
-            
-            result = assess_document({"content": "test"})
-        
-        # Check that logs were created
-        log_check_after = check_log_files_created()
-        
-        if not log_check_after["log_file_created"]:
-            raise AssertionError("Log file was not created")
-        
-        if not log_check_after["json_file_created"]:
-            raise AssertionError("JSON file was not created")
-        
-        print("   ✓ Log files created successfully")
-        print("   ✓ JSON workflow data exported")
-    
-    def test_performance_benchmarks(self):
-        """Test performance against benchmarks."""
-        try:
-            from worker.agents.orchestrator import assess_document
-        except ImportError:
-            print("⚠️  Could not import assess_document - skipping performance test")
-            print("   Expected benchmarks:")
-            for metric, value in PERFORMANCE_BENCHMARKS.items():
-                print(f"     {metric}: {value}")
-            return
-        
-        mocks = create_mock_dependencies()
-        setup_scam_detection_mocks(mocks, "high_confidence_scam")
-        
-        def run_assessment():
-            with patch('worker.agents.orchestrator.call_tool', mocks['call_tool']), \
-                 patch('worker.tools.selector.process_document', mocks['process_document']), \
-                 patch('worker.tools.selector.choose_tools', mocks['choose_tools']):
-                return assess_document({"content": "test"})
-        
-        # Measure performance
-        perf_data = measure_performance(run_assessment)
-        
-        # Check against benchmarks
-        if perf_data["execution_time"] > PERFORMANCE_BENCHMARKS["max_processing_time"]:
-            print(f"   ⚠️  Execution time ({perf_data['execution_time']:.2f}s) exceeds benchmark ({PERFORMANCE_BENCHMARKS['max_processing_time']}s)")
-        else:
-            print(f"   ✓ Execution time: {perf_data['execution_time']:.2f}s (within benchmark)")
-        
-        if perf_data["success"]:
-            result = perf_data["result"]
-            evidence_count = len(result.get("tool_evidence", []))
-            print(f"   ✓ Evidence items: {evidence_count}")
-            
-            if "processing_metadata" in result:
-                metadata = result["processing_metadata"]
-                for field in PERFORMANCE_BENCHMARKS["required_metadata_fields"]:
-                    if field in metadata:
-                        print(f"   ✓ Metadata field present: {field}")
-                    else:
-                        raise AssertionError(f"Missing required metadata field: {field}")
-        else:
-            raise AssertionError(f"Performance test failed: {perf_data['error']}")
-    
+
     def run_all_tests(self):
-        """Run all tests and generate summary."""
+        """Run all tests in parallel and generate summary."""
         print("🧪 Starting comprehensive assess_document workflow tests")
         print(f"Test environment: test/worker")
         print(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # List of all tests to run
-        tests = [
-            ("High Confidence Scam Detection", self.test_high_confidence_scam_detection),
-            ("High Confidence Legitimate Detection", self.test_high_confidence_legitimate_detection),
-            ("Uncertain Case Full Analysis", self.test_uncertain_case_full_analysis),
-            ("Error Handling", self.test_error_handling),
-            ("Logging System", self.test_logging_system),
-            ("Performance Benchmarks", self.test_performance_benchmarks)
-        ]
-        
-        # Run each test
-        for test_name, test_func in tests:
-            self.run_test(test_name, test_func)
-        
+
+        # Run each test in its own process; the tests are mock-isolated and
+        # share no mutable state, so wall time is bounded by the slowest one
+        with ProcessPoolExecutor(max_workers=max(1, min(len(ALL_TESTS), (os.cpu_count() or 2) - 2)),
+                                 initializer=setup_test_environment) as executor:
+            for result in executor.map(_run_one, ALL_TESTS):
+                self._record(result)
+
         # Generate summary
         self.print_summary()
-        
+
         # Cleanup test files
         cleanup_count = cleanup_test_files()
         if cleanup_count > 0:
@@ -421,13 +479,13 @@ class SimpleTestRunner:
             
             print(f"\nFailed tests:")
             for result in self.test_results:
-                if result["status"] == "FAILED":
+                if result["status"] != "PASSED":
                     print(f"  - {result['test_name']}: {result['error']}")
         
         print(f"\nDetailed results:")
         for result in self.test_results:
             status_icon = "✅" if result["status"] == "PASSED" else "❌"
-            print(f"  {status_icon} {result['test_name']} ({result['duration']:.2f}s)")
+            print(f"  {status_icon} {result['test_name']} ({result['duration_ns'] / 1e9:.2f}s)")
 
 
 if __name__ == "__main__":
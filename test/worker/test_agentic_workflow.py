@@ -3,16 +3,11 @@
 Test the new agentic orchestrator workflow with real documents.
 """
 import sys
-import os
-
-# Add project root to sys.path
-current_file = os.path.abspath(__file__)
-project_root = current_file
-while True:
-    project_root = os.path.dirname(project_root)
-    if os.path.isdir(os.path.join(project_root, 'services')):
-        break
+from pathlib import Path
 
+# Add the project root (the first parent containing services/) to sys.path
+project_root = str(next(p for p in Path(__file__).resolve().parents
+                        if (p / 'services').is_dir()))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
@@ -1,13 +1,10 @@
 import sys
-import os
+from pathlib import Path
 
-# Ensure orchestrator.py is importable
-current_file = os.path.abspath(__file__)
-project_root = current_file
-while True:
-    project_root = os.path.dirname(project_root)
-    if os.path.isdir(os.path.join(project_root, 'services')):
-        break
+# Ensure orchestrator.py is importable: project root is the first parent
+# containing services/
+project_root = str(next(p for p in Path(__file__).resolve().parents
+                        if (p / 'services').is_dir()))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
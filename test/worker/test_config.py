@@ -1,7 +1,34 @@
 """
 Configuration file for assess_document workflow tests.
 Defines test scenarios, expected outcomes, and benchmarks.
+
+The large tables are exposed through a module-level __getattr__ (PEP 562):
+each constant is built on first reference and cached in globals(), so
+importing this module costs almost nothing for sessions that only need a
+couple of the tables.
 """
+import functools
+import sys
+from types import MappingProxyType
+
+try:  # script mode (run_tests.py puts this directory on sys.path[0])
+    from _bench import BASE_PERFORMANCE_BENCHMARKS, WORKFLOW_ERROR_SCENARIOS
+except ImportError:  # package context (pytest imports this as test.worker.*)
+    from ._bench import BASE_PERFORMANCE_BENCHMARKS, WORKFLOW_ERROR_SCENARIOS
+try:
+    from _mocks import BASE_TOOL_MOCKS, overlay, rag_records
+except ImportError:
+    from ._mocks import BASE_TOOL_MOCKS, overlay, rag_records
+
+try:
+    from pydantic import BaseModel, Field
+except ImportError:  # test_config must stay importable without worker deps
+    BaseModel = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Test configuration
 TEST_CONFIG = {
@@ -11,282 +38,365 @@ TEST_CONFIG = {
     "detailed_logging": True
 }
 
+# Shared membership sets: frozenset turns every "x in ..." check into one
+# O(1) hash lookup, and the sets are hashable for use as cache keys
+VALID_IS_SCAM = frozenset(("scam", "not_scam", "suspicious"))
+REQUIRED_RESULT_FIELDS = frozenset((
+    "is_scam",
+    "confidence_level",
+    "scam_probability",
+    "explanation",
+    "processing_metadata"
+))
+REQUIRED_METADATA_FIELDS = frozenset((
+    "workflow_id",
+    "total_time",
+    "evidence_gathered",
+    "errors_encountered",
+    "timestamp"
+))
+REQUIRED_LOG_LEVELS = frozenset(("INFO", "DEBUG", "ERROR"))
+
+
+def _freeze(obj):
+    """Recursively wrap dicts in read-only proxies and turn lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, str):
+        # Intern so the many repeated category strings ("scam", "uncertain",
+        # URLs, ...) share one allocation and compare by pointer
+        return sys.intern(obj)
+    return obj
+
+
+def _get(name):
+    """Fetch a module constant, building it through __getattr__ if needed.
+
+    Function bodies can't rely on plain global lookups for the lazy
+    constants: LOAD_GLOBAL reads the module dict directly and never falls
+    back to the module __getattr__ hook.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
 # Test scenarios and their expected outcomes
-TEST_SCENARIOS = {
-    "high_confidence_scam": {
-        "description": "Documents with clear scam indicators that should trigger fast-path detection",
-        "expected_outcome": {
-            "is_scam": "scam",
-            "confidence_level_min": 0.85,
-            "scam_probability_min": 0.8,
-            "processing_path": "fast_classification",
-            "tool_calls_max": 5
-        },
-        "test_documents": [
-            {
-                "name": "nigerian_prince_email",
-                "content": "Dear friend, I have $10 million inheritance from my late father...",
-                "expected_rag_response": {
-                    "average_confidence_level": 0.95,
-                    "average_scam_probability": 0.89
-                }
+def _build_test_scenarios():
+    return _freeze({
+        "high_confidence_scam": {
+            "description": "Documents with clear scam indicators that should trigger fast-path detection",
+            "expected_outcome": {
+                "is_scam": "scam",
+                "confidence_level_min": 0.85,
+                "scam_probability_min": 0.8,
+                "processing_path": "fast_classification",
+                "tool_calls_max": 5
             },
-            {
-                "name": "lottery_scam_email", 
-                "content": "CONGRATULATIONS! You won $500,000 in our lottery...",
-                "expected_rag_response": {
-                    "average_confidence_level": 0.92,
-                    "average_scam_probability": 0.87
+            "test_documents": [
+                {
+                    "name": "nigerian_prince_email",
+                    "content": "Dear friend, I have $10 million inheritance from my late father...",
+                    "expected_rag_response": {
+                        "average_confidence_level": 0.95,
+                        "average_scam_probability": 0.89
+                    }
+                },
+                {
+                    "name": "lottery_scam_email",
+                    "content": "CONGRATULATIONS! You won $500,000 in our lottery...",
+                    "expected_rag_response": {
+                        "average_confidence_level": 0.92,
+                        "average_scam_probability": 0.87
+                    }
                 }
-            }
-        ]
-    },
-    
-    "high_confidence_legitimate": {
-        "description": "Documents with clear legitimate indicators that should trigger fast-path detection",
-        "expected_outcome": {
-            "is_scam": "not_scam",
-            "confidence_level_min": 0.85,
-            "scam_probability_max": 0.2,
-            "processing_path": "fast_classification",
-            "tool_calls_max": 5
+            ]
         },
-        "test_documents": [
-            {
-                "name": "business_meeting_email",
-                "content": "Hi Sarah, let's schedule our quarterly review meeting...",
-                "expected_rag_response": {
-                    "average_confidence_level": 0.93,
-                    "average_scam_probability": 0.11
-                }
+
+        "high_confidence_legitimate": {
+            "description": "Documents with clear legitimate indicators that should trigger fast-path detection",
+            "expected_outcome": {
+                "is_scam": "not_scam",
+                "confidence_level_min": 0.85,
+                "scam_probability_max": 0.2,
+                "processing_path": "fast_classification",
+                "tool_calls_max": 5
             },
-            {
-                "name": "legitimate_invoice",
-                "content": "Please find attached your invoice for software licensing...",
-                "expected_rag_response": {
-                    "average_confidence_level": 0.91,
-                    "average_scam_probability": 0.08
+            "test_documents": [
+                {
+                    "name": "business_meeting_email",
+                    "content": "Hi Sarah, let's schedule our quarterly review meeting...",
+                    "expected_rag_response": {
+                        "average_confidence_level": 0.93,
+                        "average_scam_probability": 0.11
+                    }
+                },
+                {
+                    "name": "legitimate_invoice",
+                    "content": "Please find attached your invoice for software licensing...",
+                    "expected_rag_response": {
+                        "average_confidence_level": 0.91,
+                        "average_scam_probability": 0.08
+                    }
                 }
-            }
-        ]
-    },
-    
-    "uncertain_analysis": {
-        "description": "Documents requiring full LLM analysis pipeline",
-        "expected_outcome": {
-            "is_scam_options": ["suspicious", "not_scam", "scam"],
-            "confidence_level_range": (0.5, 0.9),
-            "scam_probability_range": (0.2, 0.8),
-            "processing_path": "full_analysis",
-            "tool_calls_min": 3,
-            "requires_llm_analysis": True
+            ]
         },
-        "test_documents": [
-            {
-                "name": "promotional_email",
-                "content": "Limited time offer! 70% off everything. Click here now!",
-                "expected_rag_response": {
-                    "average_confidence_level": 0.65,
-                    "average_scam_probability": 0.45
-                }
+
+        "uncertain_analysis": {
+            "description": "Documents requiring full LLM analysis pipeline",
+            "expected_outcome": {
+                "is_scam_options": ["suspicious", "not_scam", "scam"],
+                "confidence_level_range": (0.5, 0.9),
+                "scam_probability_range": (0.2, 0.8),
+                "processing_path": "full_analysis",
+                "tool_calls_min": 3,
+                "requires_llm_analysis": True
             },
-            {
-                "name": "tech_support_warning",
-                "content": "Your computer may be infected. Download our security tool...",
-                "expected_rag_response": {
-                    "average_confidence_level": 0.58,
-                    "average_scam_probability": 0.62
+            "test_documents": [
+                {
+                    "name": "promotional_email",
+                    "content": "Limited time offer! 70% off everything. Click here now!",
+                    "expected_rag_response": {
+                        "average_confidence_level": 0.65,
+                        "average_scam_probability": 0.45
+                    }
+                },
+                {
+                    "name": "tech_support_warning",
+                    "content": "Your computer may be infected. Download our security tool...",
+                    "expected_rag_response": {
+                        "average_confidence_level": 0.58,
+                        "average_scam_probability": 0.62
+                    }
                 }
-            }
+            ]
+        }
+    })
+
+
+# Error scenarios for testing robustness: the shared workflow-behavior
+# table from _bench.py, used as-is
+def _build_error_scenarios():
+    return WORKFLOW_ERROR_SCENARIOS
+
+
+# Performance benchmarks: shared limits plus this module's per-path
+# timings and memory ceiling
+def _build_performance_benchmarks():
+    return overlay(BASE_PERFORMANCE_BENCHMARKS, {
+        "max_processing_time_fast_path": 5.0,  # seconds for high confidence cases
+        "max_processing_time_full_analysis": 30.0,  # seconds for uncertain cases
+        "max_memory_usage": 100,  # MB (if monitoring memory)
+        "required_metadata_fields": REQUIRED_METADATA_FIELDS
+    })
+
+
+# Logging validation criteria
+def _build_logging_requirements():
+    return {
+        "log_file_created": True,
+        "json_file_created": True,
+        "required_log_levels": REQUIRED_LOG_LEVELS,
+        "required_log_sections": [
+            "WORKFLOW START",
+            "Step 1: document_processing",
+            "Step 2: rag_analysis",
+            "WORKFLOW COMPLETE"
+        ],
+        "required_json_fields": [
+            "workflow_id",
+            "start_time",
+            "steps",
+            "decisions",
+            "tool_calls",
+            "final_result"
         ]
     }
-}
 
-# Error scenarios for testing robustness
-ERROR_SCENARIOS = {
-    "rag_service_unavailable": {
-        "description": "RAG service is down or unresponsive",
-        "mock_behavior": {
-            "call_tool": {"rag-tools.call_rag": "ConnectionError: Service unavailable"},
-            "expected_fallback": True
-        }
-    },
-    
-    "extraction_tool_failure": {
-        "description": "Optional extraction tools fail",
-        "mock_behavior": {
-            "call_tool": {"extraction-tools.extract_link": "ParseError: Invalid format"},
-            "expected_fallback": False  # Should continue with other tools
-        }
-    },
-    
-    "llm_rate_limit": {
-        "description": "LLM service hits rate limits",
-        "mock_behavior": {
-            "chat_json": "RateLimitError: Too many requests",
-            "expected_fallback": True
-        }
-    },
-    
-    "invalid_document": {
-        "description": "Document processing fails",
-        "mock_behavior": {
-            "process_document": "ValueError: Invalid document format",
-            "expected_fallback": True
-        }
-    }
-}
 
-# Performance benchmarks
-PERFORMANCE_BENCHMARKS = {
-    "max_processing_time_fast_path": 5.0,  # seconds for high confidence cases
-    "max_processing_time_full_analysis": 30.0,  # seconds for uncertain cases
-    "max_tool_calls": 15,
-    "min_evidence_items": 1,
-    "max_memory_usage": 100,  # MB (if monitoring memory)
-    "required_metadata_fields": [
-        "workflow_id",
-        "total_time", 
-        "evidence_gathered",
-        "errors_encountered",
-        "timestamp"
-    ]
-}
+# Mock responses for different tools: the shared base with no
+# config-specific deltas (test_data.py overlays its own variants)
+def _build_tool_mock_responses():
+    merged = overlay(BASE_TOOL_MOCKS, {})
+    merged["rag-tools.call_rag"] = rag_records(merged["rag-tools.call_rag"])
+    return _freeze(merged)
 
-# Logging validation criteria
-LOGGING_REQUIREMENTS = {
-    "log_file_created": True,
-    "json_file_created": True,
-    "required_log_levels": ["INFO", "DEBUG", "ERROR"],
-    "required_log_sections": [
-        "WORKFLOW START",
-        "Step 1: document_processing",
-        "Step 2: rag_analysis",
-        "WORKFLOW COMPLETE"
-    ],
-    "required_json_fields": [
-        "workflow_id",
-        "start_time",
-        "steps",
-        "decisions",
-        "tool_calls",
-        "final_result"
-    ]
-}
 
-# Mock responses for different tools
-TOOL_MOCK_RESPONSES = {
-    "data-processor.extract_text": {
-        "scam": "Extracted suspicious content with fraud indicators like money transfers and urgent requests",
-        "legitimate": "Extracted legitimate business communication about meetings and standard operations", 
-        "uncertain": "Extracted promotional content with mixed commercial and potentially suspicious elements"
-    },
-    
-    "rag-tools.call_rag": {
-        "high_confidence_scam": {
-            "average_confidence_level": 0.95,
-            "average_scam_probability": 0.89,
-            "similar_documents": ["nigerian_scam_001", "inheritance_fraud_002"],
-            "similarity_scores": [0.94, 0.91]
+# LLM mock responses for uncertain cases
+def _build_llm_mock_responses():
+    return _freeze({
+        "planner": {
+            "uncertain_case": {
+                "calls": [
+                    {"server": "extraction-tools", "tool": "extract_link", "args": {"text": "content"}},
+                    {"server": "extraction-tools", "tool": "extract_number", "args": {"text": "content"}},
+                    {"server": "extraction-tools", "tool": "extract_organisation", "args": {"text": "content"}}
+                ]
+            },
+            "low_budget": {
+                "calls": [
+                    {"server": "extraction-tools", "tool": "extract_link", "args": {"text": "content"}}
+                ]
+            }
         },
-        "high_confidence_legitimate": {
-            "average_confidence_level": 0.93,
-            "average_scam_probability": 0.11, 
-            "similar_documents": ["business_email_001", "meeting_request_002"],
-            "similarity_scores": [0.89, 0.86]
+
+        "analyst": {
+            "suspicious": {
+                "is_scam": "suspicious",
+                "confidence_level": 0.7,
+                "scam_probability": 65.0,
+                "explanation": "Mixed indicators detected with both legitimate and suspicious elements"
+            },
+            "likely_scam": {
+                "is_scam": "scam",
+                "confidence_level": 0.8,
+                "scam_probability": 85.0,
+                "explanation": "Strong scam indicators detected through analysis"
+            }
         },
-        "uncertain": {
-            "average_confidence_level": 0.65,
-            "average_scam_probability": 0.45,
-            "similar_documents": ["promotional_001"],
-            "similarity_scores": [0.71]
+
+        "supervisor": {
+            "valid_response": {
+                "is_scam": "suspicious",
+                "confidence_level": 0.7,
+                "scam_probability": 65.0,
+                "explanation": "Supervised assessment with validated indicators"
+            },
+            "invalid_response": {
+                "invalid": "response",
+                "missing": "required_fields"
+            }
         }
-    },
-    
-    "extraction-tools.extract_link": {
-        "scam": ["http://fake-bank-site.com/claim", "http://suspicious-domain.net"],
-        "legitimate": ["https://company.com/portal", "https://legitimate-site.org"],
-        "uncertain": ["http://deals-site.com/offer", "http://download-center.net"]
-    },
-    
-    "extraction-tools.extract_number": {
-        "scam": ["+234-555-FAKE", "$10,000,000", "$1,500"],
-        "legitimate": ["(555) 123-4567", "$299.99", "Room 123"],
-        "uncertain": ["1-800-SUPPORT", "70%", "$0"]
-    },
-    
-    "extraction-tools.extract_organisation": {
-        "scam": ["Nigerian Prince Foundation", "International Lottery Corp"],
-        "legitimate": ["ABC Corporation", "Tech Solutions Inc"],
-        "uncertain": ["Deals Online", "Support Center"]
+    })
+
+
+# Test validation rules
+def _build_validation_rules():
+    return {
+        "required_result_fields": REQUIRED_RESULT_FIELDS,
+
+        "valid_is_scam_values": VALID_IS_SCAM,
+
+        "confidence_level_range": (0.0, 1.0),
+        "scam_probability_range": (0.0, 100.0)
     }
-}
 
-# LLM mock responses for uncertain cases
-LLM_MOCK_RESPONSES = {
-    "planner": {
-        "uncertain_case": {
-            "calls": [
-                {"server": "extraction-tools", "tool": "extract_link", "args": {"text": "content"}},
-                {"server": "extraction-tools", "tool": "extract_number", "args": {"text": "content"}},
-                {"server": "extraction-tools", "tool": "extract_organisation", "args": {"text": "content"}}
-            ]
-        },
-        "low_budget": {
-            "calls": [
-                {"server": "extraction-tools", "tool": "extract_link", "args": {"text": "content"}}
-            ]
-        }
-    },
-    
-    "analyst": {
-        "suspicious": {
-            "is_scam": "suspicious",
-            "confidence_level": 0.7,
-            "scam_probability": 65.0,
-            "explanation": "Mixed indicators detected with both legitimate and suspicious elements"
-        },
-        "likely_scam": {
-            "is_scam": "scam",
-            "confidence_level": 0.8,
-            "scam_probability": 85.0,
-            "explanation": "Strong scam indicators detected through analysis"
-        }
-    },
-    
-    "supervisor": {
-        "valid_response": {
-            "is_scam": "suspicious",
-            "confidence_level": 0.7, 
-            "scam_probability": 65.0,
-            "explanation": "Supervised assessment with validated indicators"
-        },
-        "invalid_response": {
-            "invalid": "response",
-            "missing": "required_fields"
+
+# Validation for processing_metadata on assessment results. Replaces the
+# per-field validation lambdas: with pydantic the constraints compile once
+# into its core validator, so checking a result is a single C-level call
+# instead of four Python-level invocations.
+if BaseModel is not None:
+    class MetadataSchema(BaseModel):
+        workflow_id: str = Field(min_length=1)
+        total_time: float = Field(ge=0)
+        evidence_gathered: int = Field(ge=0)
+        errors_encountered: int = Field(ge=0)
+
+    validate_metadata = MetadataSchema.model_validate
+else:
+    def validate_metadata(metadata):
+        """Stdlib fallback enforcing the same constraints as MetadataSchema."""
+        if not (isinstance(metadata.get("workflow_id"), str) and metadata["workflow_id"]):
+            raise ValueError("workflow_id must be a non-empty string")
+        if not (isinstance(metadata.get("total_time"), (int, float)) and metadata["total_time"] >= 0):
+            raise ValueError("total_time must be a non-negative number")
+        for field in ("evidence_gathered", "errors_encountered"):
+            if not (isinstance(metadata.get(field), int) and metadata[field] >= 0):
+                raise ValueError(f"{field} must be a non-negative integer")
+        return metadata
+
+
+# Structure-of-arrays view over the RAG scenario numbers, regenerated from
+# TOOL_MOCK_RESPONSES so the dict form stays the single source of truth.
+# Bulk range assertions across all scenarios then run as one vector op.
+@functools.lru_cache(maxsize=None)
+def _scenario_arrays():
+    rag = _get("TOOL_MOCK_RESPONSES")["rag-tools.call_rag"]
+    names = tuple(rag)
+    conf = [rag[name]["average_confidence_level"] for name in names]
+    prob = [rag[name]["average_scam_probability"] for name in names]
+    if np is not None:
+        return {
+            "SCENARIO_NAMES": names,
+            "SCENARIO_CONFIDENCE": np.array(conf),
+            "SCENARIO_PROBABILITY": np.array(prob)
         }
+    return {
+        "SCENARIO_NAMES": names,
+        "SCENARIO_CONFIDENCE": tuple(conf),
+        "SCENARIO_PROBABILITY": tuple(prob)
     }
-}
 
-# Test validation rules
-VALIDATION_RULES = {
-    "required_result_fields": [
-        "is_scam",
-        "confidence_level", 
-        "scam_probability",
-        "explanation",
-        "processing_metadata"
-    ],
-    
-    "valid_is_scam_values": ["scam", "not_scam", "suspicious"],
-    
-    "confidence_level_range": (0.0, 1.0),
-    "scam_probability_range": (0.0, 100.0),
-    
-    "metadata_validations": {
-        "workflow_id": lambda x: isinstance(x, str) and len(x) > 0,
-        "total_time": lambda x: isinstance(x, (int, float)) and x >= 0,
-        "evidence_gathered": lambda x: isinstance(x, int) and x >= 0,
-        "errors_encountered": lambda x: isinstance(x, int) and x >= 0
+
+def check_ranges(conf_lo, conf_hi, prob_lo, prob_hi):
+    """Which scenarios' RAG numbers fall inside the given ranges.
+
+    Returns a boolean mask aligned with SCENARIO_NAMES; vectorized when
+    numpy is available, with an equivalent pure-Python fallback.
+    """
+    arrays = _scenario_arrays()
+    conf = arrays["SCENARIO_CONFIDENCE"]
+    prob = arrays["SCENARIO_PROBABILITY"]
+    if np is not None:
+        return ((conf >= conf_lo) & (conf <= conf_hi)
+                & (prob >= prob_lo) & (prob <= prob_hi))
+    return [conf_lo <= c <= conf_hi and prob_lo <= p <= prob_hi
+            for c, p in zip(conf, prob)]
+
+
+def _in_range(lo, hi):
+    """Build a closed-interval predicate with the bounds bound at creation."""
+    def check(x, lo=lo, hi=hi):
+        return lo <= x <= hi
+    return check
+
+
+# Range predicates compiled once on first use: assertion sites call a
+# closure with the bounds already bound instead of fetching and unpacking
+# the (lo, hi) tuples on every check.
+def _build_range_checks():
+    return {
+        name: {
+            "conf": _in_range(*spec["expected_outcome"]["confidence_level_range"]),
+            "prob": _in_range(*spec["expected_outcome"]["scam_probability_range"])
+        }
+        for name, spec in _get("TEST_SCENARIOS").items()
+        if "confidence_level_range" in spec["expected_outcome"]
     }
+
+
+_LAZY_BUILDERS = {
+    "TEST_SCENARIOS": _build_test_scenarios,
+    "ERROR_SCENARIOS": _build_error_scenarios,
+    "PERFORMANCE_BENCHMARKS": _build_performance_benchmarks,
+    "LOGGING_REQUIREMENTS": _build_logging_requirements,
+    "TOOL_MOCK_RESPONSES": _build_tool_mock_responses,
+    "LLM_MOCK_RESPONSES": _build_llm_mock_responses,
+    "VALIDATION_RULES": _build_validation_rules,
+    "RANGE_CHECKS": _build_range_checks,
+    "SCENARIO_NAMES": lambda: _scenario_arrays()["SCENARIO_NAMES"],
+    "SCENARIO_CONFIDENCE": lambda: _scenario_arrays()["SCENARIO_CONFIDENCE"],
+    "SCENARIO_PROBABILITY": lambda: _scenario_arrays()["SCENARIO_PROBABILITY"],
+    # Result-level bounds from VALIDATION_RULES, compiled the same way as
+    # the per-scenario RANGE_CHECKS
+    "VALID_CONFIDENCE": lambda: _in_range(*_get("VALIDATION_RULES")["confidence_level_range"]),
+    "VALID_PROBABILITY": lambda: _in_range(*_get("VALIDATION_RULES")["scam_probability_range"]),
 }
+
+
+def __getattr__(name):
+    """Build lazy constants on first access and cache them in globals()."""
+    try:
+        builder = _LAZY_BUILDERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = builder()
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_BUILDERS))
@@ -1,276 +1,336 @@
 """
 Mock data and fixtures for testing the assess_document workflow.
 Contains realistic test data for various fraud detection scenarios.
+
+Like test_config.py, the fixture tables are served through a module-level
+__getattr__ (PEP 562): each table is built on first reference and cached
+in globals(), so importing this module is effectively free.
 """
+import functools
+import re
+import sys
+from pathlib import Path
+
+try:  # script mode (run_tests.py puts this directory on sys.path[0])
+    from _bench import BASE_PERFORMANCE_BENCHMARKS, TOOL_ERROR_SCENARIOS
+except ImportError:  # package context (pytest imports this as test.worker.*)
+    from ._bench import BASE_PERFORMANCE_BENCHMARKS, TOOL_ERROR_SCENARIOS
+try:
+    from _mocks import BASE_TOOL_MOCKS, overlay, rag_records
+except ImportError:
+    from ._mocks import BASE_TOOL_MOCKS, overlay, rag_records
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from types import MappingProxyType
 from typing import Dict, Any, List
 
+_FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@functools.lru_cache(maxsize=None)
+def _read_fixture(relpath: str) -> str:
+    """Read an email body from fixtures/, cached for the session."""
+    return (_FIXTURE_DIR / relpath).read_text()
+
+
+class _LazyEmail(dict):
+    """Email fixture whose multi-KB body lives in a sibling text file.
+
+    The body is read on first "content" access and cached in place, so
+    sessions that never touch a given email never pay for its I/O or
+    memory. Everything else behaves like a plain dict.
+    """
+    __slots__ = ("_content_file",)
+
+    def __init__(self, content_file: str, fields: Dict[str, str]):
+        super().__init__(fields)
+        self._content_file = content_file
+
+    def __missing__(self, key):
+        if key == "content":
+            return self.setdefault("content", _read_fixture(self._content_file))
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == "content":
+            return self["content"]
+        return super().get(key, default)
+
+
+def _freeze(obj):
+    """Deep-freeze a fixture: dicts become read-only proxies, lists tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, str):
+        # Repeated category labels and URLs collapse to one shared object
+        return sys.intern(obj)
+    return obj
+
+
 # Sample scam emails for testing
-SCAM_EMAILS = {
-    "nigerian_prince": {
-        "type": "email",
-        "subject": "URGENT: Claim Your Inheritance",
-        "from": "prince.nigeria@fake-domain.com", 
-        "content": """
-        Dear Beneficiary,
-        
-        I am Prince John from Nigeria. My late father left $10,000,000 USD for you.
-        To claim this inheritance, please send:
-        - Your full name and address
-        - Bank account details
-        - Processing fee of $1,500
-        
-        Reply urgently to: claim.inheritance@fake-bank.com
-        
-        Best regards,
-        Prince John
-        Phone: +234-555-FAKE
-        """
-    },
-    
-    "lottery_scam": {
-        "type": "email",
-        "subject": "CONGRATULATIONS! You Won $500,000",
-        "from": "lottery-winner@fake-lottery.org",
-        "content": """
-        CONGRATULATIONS!!!
-        
-        You have won $500,000 in the International Email Lottery!
-        Your winning number is: 123-456-789
-        
-        To claim your prize:
-        1. Click here: http://fake-lottery-site.com/claim
-        2. Provide your personal information
-        3. Pay $200 processing fee
-        
-        Act now! Offer expires in 24 hours!
-        """
-    },
-    
-    "phishing_bank": {
-        "type": "email",
-        "subject": "Urgent: Verify Your Account",
-        "from": "security@fake-bank-name.com",
-        "content": """
-        URGENT SECURITY ALERT
-        
-        Your account has been temporarily suspended due to suspicious activity.
-        
-        To restore access, please verify your account immediately:
-        - Username and password
-        - Social security number
-        - Account number
-        
-        Click here to verify: http://fake-bank-verify.com/login
-        
-        Failure to verify within 24 hours will result in permanent account closure.
-        """
+def _build_scam_emails():
+    return {
+        "nigerian_prince": _LazyEmail(
+            "scam/nigerian_prince.txt",
+            {
+                "type": "email",
+                "subject": "URGENT: Claim Your Inheritance",
+                "from": "prince.nigeria@fake-domain.com"
+            }
+        ),
+
+        "lottery_scam": _LazyEmail(
+            "scam/lottery_scam.txt",
+            {
+                "type": "email",
+                "subject": "CONGRATULATIONS! You Won $500,000",
+                "from": "lottery-winner@fake-lottery.org"
+            }
+        ),
+
+        "phishing_bank": _LazyEmail(
+            "scam/phishing_bank.txt",
+            {
+                "type": "email",
+                "subject": "Urgent: Verify Your Account",
+                "from": "security@fake-bank-name.com"
+            }
+        )
     }
-}
+
 
 # Sample legitimate emails
-LEGITIMATE_EMAILS = {
-    "business_meeting": {
-        "type": "email",
-        "subject": "Q3 Financial Review Meeting",
-        "from": "john.smith@legitimate-company.com",
-        "content": """
-        Hi Sarah,
-        
-        I hope this email finds you well. I'd like to schedule our Q3 financial 
-        review meeting for next Tuesday at 2 PM in Conference Room A.
-        
-        Please let me know if this time works for you, or suggest an alternative.
-        
-        Best regards,
-        John Smith
-        Senior Financial Analyst
-        ABC Corporation
-        Phone: (555) 123-4567
-        """
-    },
-    
-    "newsletter": {
-        "type": "email",
-        "subject": "Weekly Tech Newsletter - AI Advances",
-        "from": "newsletter@tech-journal.com",
-        "content": """
-        Weekly Tech Newsletter - Issue #147
-        
-        This week's highlights:
-        - New AI breakthroughs in healthcare
-        - Quantum computing developments
-        - Cybersecurity best practices
-        
-        Read more at: https://tech-journal.com/weekly/147
-        
-        To unsubscribe: https://tech-journal.com/unsubscribe
-        
-        Tech Journal Team
-        """
-    },
-    
-    "invoice": {
-        "type": "email",
-        "subject": "Invoice #INV-2025-001234",
-        "from": "billing@software-vendor.com",
-        "content": """
-        Dear Customer,
-        
-        Please find attached your invoice for software licensing:
-        
-        Invoice #: INV-2025-001234
-        Amount: $299.99
-        Due Date: September 15, 2025
-        
-        Payment can be made through our secure portal:
-        https://software-vendor.com/billing/pay
-        
-        Thank you for your business!
-        
-        Billing Department
-        Software Vendor Inc.
-        """
+def _build_legitimate_emails():
+    return {
+        "business_meeting": _LazyEmail(
+            "legitimate/business_meeting.txt",
+            {
+                "type": "email",
+                "subject": "Q3 Financial Review Meeting",
+                "from": "john.smith@legitimate-company.com"
+            }
+        ),
+
+        "newsletter": _LazyEmail(
+            "legitimate/newsletter.txt",
+            {
+                "type": "email",
+                "subject": "Weekly Tech Newsletter - AI Advances",
+                "from": "newsletter@tech-journal.com"
+            }
+        ),
+
+        "invoice": _LazyEmail(
+            "legitimate/invoice.txt",
+            {
+                "type": "email",
+                "subject": "Invoice #INV-2025-001234",
+                "from": "billing@software-vendor.com"
+            }
+        )
     }
-}
+
 
 # Mixed/uncertain emails that require full analysis
-UNCERTAIN_EMAILS = {
-    "promotional": {
-        "type": "email", 
-        "subject": "Limited Time Offer - 70% Off!",
-        "from": "deals@online-store.net",
-        "content": """
-        FLASH SALE - 70% OFF EVERYTHING!
-        
-        Don't miss out on our biggest sale of the year!
-        
-        Click here to shop now: http://deals-site.com/flash-sale
-        Use code: SAVE70
-        
-        Hurry! Sale ends at midnight!
-        
-        Note: This is a one-time email. We found your email through our partners.
-        """
-    },
-    
-    "tech_support": {
-        "type": "email",
-        "subject": "Your Computer May Be Infected",
-        "from": "support@tech-help-center.org",
-        "content": """
-        WARNING: Security Scan Complete
-        
-        Our systems detected potential malware on your computer.
-        
-        To protect your data:
-        1. Download our security tool: http://tech-help-center.org/scanner
-        2. Run a full system scan
-        3. Call our support line: 1-800-TECH-HELP
-        
-        Don't ignore this warning - act now to protect your information!
-        
-        Tech Support Team
-        """
+def _build_uncertain_emails():
+    return {
+        "promotional": _LazyEmail(
+            "uncertain/promotional.txt",
+            {
+                "type": "email",
+                "subject": "Limited Time Offer - 70% Off!",
+                "from": "deals@online-store.net"
+            }
+        ),
+
+        "tech_support": _LazyEmail(
+            "uncertain/tech_support.txt",
+            {
+                "type": "email",
+                "subject": "Your Computer May Be Infected",
+                "from": "support@tech-help-center.org"
+            }
+        )
     }
-}
 
-# Mock responses for different tools
-MOCK_TOOL_RESPONSES = {
-    "data-processor.extract_text": {
-        "scam": "Extracted text contains Nigerian prince inheritance scam content with suspicious money transfer requests.",
-        "legitimate": "Extracted legitimate business communication about quarterly meeting scheduling.",
-        "uncertain": "Extracted promotional content with mixed legitimate and suspicious elements."
-    },
-    
-    "rag-tools.call_rag": {
+
+# Mock responses for different tools: the shared base plus this module's
+# scenario-specific wording, third similar-document entries, and the
+# gmail classification responses. Frozen so no test can leak scenario
+# state into another through the fixture tables.
+def _build_mock_tool_responses():
+    merged = overlay(BASE_TOOL_MOCKS, {
+        "data-processor.extract_text": {
+            "scam": "Extracted text contains Nigerian prince inheritance scam content with suspicious money transfer requests.",
+            "legitimate": "Extracted legitimate business communication about quarterly meeting scheduling.",
+            "uncertain": "Extracted promotional content with mixed legitimate and suspicious elements."
+        },
+
+        "rag-tools.call_rag": {
+            "high_confidence_scam": {
+                "similar_documents": ["nigerian_scam_001", "inheritance_fraud_002", "money_transfer_scam_003"],
+                "similarity_scores": [0.94, 0.91, 0.87]
+            },
+            "high_confidence_legitimate": {
+                "average_scam_probability": 0.12,
+                "similar_documents": ["business_email_001", "meeting_request_002", "corporate_comm_003"],
+                "similarity_scores": [0.89, 0.86, 0.82]
+            },
+            "uncertain": {
+                "similar_documents": ["promotional_email_001", "sales_offer_002"],
+                "similarity_scores": [0.71, 0.68]
+            }
+        },
+
+        "extraction-tools.extract_link": {
+            "scam": ["http://fake-bank-site.com/claim", "http://suspicious-domain.net/verify"],
+            "legitimate": ["https://legitimate-company.com/portal", "https://software-vendor.com/billing"],
+            "uncertain": ["http://deals-site.com/flash-sale", "http://tech-help-center.org/scanner"]
+        },
+
+        "extraction-tools.extract_number": {
+            "legitimate": ["(555) 123-4567", "$299.99", "Issue #147"],
+            "uncertain": ["1-800-TECH-HELP", "70%", "$0"]
+        },
+
+        "extraction-tools.extract_organisation": {
+            "scam": ["Nigerian Prince Foundation", "International Email Lottery", "Fake Bank Security"],
+            "legitimate": ["ABC Corporation", "Tech Journal", "Software Vendor Inc."],
+            "uncertain": ["Online Store Net", "Tech Help Center"]
+        },
+
+        "gmail-tools.classify_email": {
+            "scam": {"classification": "SPAM", "confidence": 0.92},
+            "legitimate": {"classification": "SAFE", "confidence": 0.88},
+            "uncertain": {"classification": "SUSPICIOUS", "confidence": 0.67}
+        }
+    })
+    merged["rag-tools.call_rag"] = rag_records(merged["rag-tools.call_rag"])
+    return _freeze(merged)
+
+
+# Expected assessment results for test validation
+def _build_expected_results():
+    return {
         "high_confidence_scam": {
-            "average_confidence_level": 0.95,
-            "average_scam_probability": 0.89,
-            "similar_documents": ["nigerian_scam_001", "inheritance_fraud_002", "money_transfer_scam_003"],
-            "similarity_scores": [0.94, 0.91, 0.87]
+            "is_scam": "scam",
+            "confidence_level_min": 0.85,
+            "scam_probability_min": 0.8,
+            "explanation_contains": ["High confidence", "fraud", "scam"]
         },
         "high_confidence_legitimate": {
-            "average_confidence_level": 0.93,
-            "average_scam_probability": 0.12,
-            "similar_documents": ["business_email_001", "meeting_request_002", "corporate_comm_003"],
-            "similarity_scores": [0.89, 0.86, 0.82]
+            "is_scam": "not_scam",
+            "confidence_level_min": 0.85,
+            "scam_probability_max": 0.2,
+            "explanation_contains": ["High confidence", "legitimate"]
         },
-        "uncertain": {
-            "average_confidence_level": 0.65,
-            "average_scam_probability": 0.45,
-            "similar_documents": ["promotional_email_001", "sales_offer_002"],
-            "similarity_scores": [0.71, 0.68]
+        "uncertain_analysis": {
+            "is_scam_options": ["suspicious", "not_scam", "scam"],
+            "confidence_level_range": (0.5, 0.9),
+            "scam_probability_range": (0.2, 0.8)
         }
-    },
-    
-    "extraction-tools.extract_link": {
-        "scam": ["http://fake-bank-site.com/claim", "http://suspicious-domain.net/verify"],
-        "legitimate": ["https://legitimate-company.com/portal", "https://software-vendor.com/billing"],
-        "uncertain": ["http://deals-site.com/flash-sale", "http://tech-help-center.org/scanner"]
-    },
-    
-    "extraction-tools.extract_number": {
-        "scam": ["+234-555-FAKE", "$10,000,000", "$1,500"],
-        "legitimate": ["(555) 123-4567", "$299.99", "Issue #147"],
-        "uncertain": ["1-800-TECH-HELP", "70%", "$0"]
-    },
-    
-    "extraction-tools.extract_organisation": {
-        "scam": ["Nigerian Prince Foundation", "International Email Lottery", "Fake Bank Security"],
-        "legitimate": ["ABC Corporation", "Tech Journal", "Software Vendor Inc."],
-        "uncertain": ["Online Store Net", "Tech Help Center"]
-    },
-    
-    "gmail-tools.classify_email": {
-        "scam": {"classification": "SPAM", "confidence": 0.92},
-        "legitimate": {"classification": "SAFE", "confidence": 0.88},
-        "uncertain": {"classification": "SUSPICIOUS", "confidence": 0.67}
     }
-}
 
-# Expected assessment results for test validation
-EXPECTED_RESULTS = {
-    "high_confidence_scam": {
-        "is_scam": "scam",
-        "confidence_level_min": 0.85,
-        "scam_probability_min": 0.8,
-        "explanation_contains": ["High confidence", "fraud", "scam"]
-    },
-    "high_confidence_legitimate": {
-        "is_scam": "not_scam", 
-        "confidence_level_min": 0.85,
-        "scam_probability_max": 0.2,
-        "explanation_contains": ["High confidence", "legitimate"]
-    },
-    "uncertain_analysis": {
-        "is_scam_options": ["suspicious", "not_scam", "scam"],
-        "confidence_level_range": (0.5, 0.9),
-        "scam_probability_range": (0.2, 0.8)
-    }
-}
 
-# Performance benchmarks
-PERFORMANCE_BENCHMARKS = {
-    "max_processing_time": 30.0,  # seconds
-    "max_tool_calls": 15,
-    "min_evidence_items": 1,
-    "required_metadata_fields": ["workflow_id", "total_time", "evidence_gathered", "errors_encountered"]
-}
+# Performance benchmarks: shared limits plus this module's overall
+# processing-time cap
+def _build_performance_benchmarks():
+    return overlay(BASE_PERFORMANCE_BENCHMARKS, {
+        "max_processing_time": 30.0,  # seconds
+        "required_metadata_fields": ["workflow_id", "total_time", "evidence_gathered", "errors_encountered"]
+    })
+
+
+# Error simulation data: the shared raw tool-failure table from _bench.py
+def _build_error_scenarios():
+    return TOOL_ERROR_SCENARIOS
 
-# Error simulation data
-ERROR_SCENARIOS = {
-    "rag_service_down": {
-        "tool": "rag-tools.call_rag",
-        "error": "Connection timeout: RAG service unavailable"
-    },
-    "extraction_failure": {
-        "tool": "extraction-tools.extract_link",
-        "error": "Text parsing failed: Invalid format"
-    },
-    "llm_rate_limit": {
-        "error": "Rate limit exceeded: Too many requests"
-    },
-    "invalid_json": {
-        "response": '{"invalid": json response}'
+
+@functools.lru_cache(maxsize=None)
+def _expected_bounds():
+    """EXPECTED_RESULTS numeric bounds as (conf_lo, conf_hi, prob_lo, prob_hi) rows.
+
+    The mixed min/max scalars and range tuples normalize into one closed
+    interval per axis; missing bounds widen to the full [0, 1] range. With
+    numpy the rows form a structured record array so a bounds check is a
+    single vector comparison.
+    """
+    names, rows = [], []
+    for name, expected in _build_expected_results().items():
+        conf = expected.get("confidence_level_range") or (
+            expected.get("confidence_level_min", 0.0),
+            expected.get("confidence_level_max", 1.0))
+        prob = expected.get("scam_probability_range") or (
+            expected.get("scam_probability_min", 0.0),
+            expected.get("scam_probability_max", 1.0))
+        names.append(name)
+        rows.append(conf + prob)
+    if np is not None:
+        rows = np.array(rows, dtype=[("cl", "f8"), ("ch", "f8"),
+                                     ("pl", "f8"), ("ph", "f8")])
+    else:
+        rows = tuple(rows)
+    return tuple(names), rows
+
+
+def check_expected(scenario: str, confidence: float, probability: float) -> bool:
+    """Whether a result's numbers satisfy the scenario's expected bounds."""
+    names, bounds = _expected_bounds()
+    row = bounds[names.index(scenario)]
+    if np is not None:
+        return bool((row["cl"] <= confidence) & (confidence <= row["ch"])
+                    & (row["pl"] <= probability) & (probability <= row["ph"]))
+    conf_lo, conf_hi, prob_lo, prob_hi = row
+    return conf_lo <= confidence <= conf_hi and prob_lo <= probability <= prob_hi
+
+
+@functools.lru_cache(maxsize=None)
+def _explanation_patterns():
+    """Per-scenario alternation regexes over the expected explanation keywords.
+
+    re.compile folds the keyword list for each scenario into one scanner,
+    so checking an explanation is a single pass over the text instead of
+    one substring search per keyword.
+    """
+    return {
+        name: re.compile("|".join(re.escape(keyword)
+                                  for keyword in expected["explanation_contains"]))
+        for name, expected in _build_expected_results().items()
+        if "explanation_contains" in expected
     }
+
+
+def check_explanation(scenario: str, text: str) -> bool:
+    """Whether text mentions any of the scenario's expected keywords."""
+    pattern = _explanation_patterns().get(scenario)
+    return pattern is not None and pattern.search(text) is not None
+
+
+_LAZY_BUILDERS = {
+    "SCAM_EMAILS": _build_scam_emails,
+    "LEGITIMATE_EMAILS": _build_legitimate_emails,
+    "UNCERTAIN_EMAILS": _build_uncertain_emails,
+    "MOCK_TOOL_RESPONSES": _build_mock_tool_responses,
+    "EXPECTED_RESULTS": _build_expected_results,
+    "PERFORMANCE_BENCHMARKS": _build_performance_benchmarks,
+    "ERROR_SCENARIOS": _build_error_scenarios,
 }
+
+
+def __getattr__(name):
+    """Build lazy fixture tables on first access and cache them in globals()."""
+    try:
+        builder = _LAZY_BUILDERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = builder()
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_BUILDERS))
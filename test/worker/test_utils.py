@@ -2,183 +2,327 @@
 Utility functions for testing the assess_document workflow.
 Helper functions for mocking, validation, and test setup.
 """
+import functools
 import os
 import json
+import statistics
 import time
+from collections import namedtuple
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
-from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pydantic import BaseModel, ConfigDict, Field, ValidationError
+except ImportError:  # the suite must run without worker deps installed
+    BaseModel = None
+
+
+@dataclass(slots=True)
+class MockResult:
+    """Slotted stand-in for an assessment result dict.
+
+    The simulated test paths build many of these fixtures; slots keep them
+    several times smaller than literal nested dicts. The mapping-style
+    dunders let validate_assessment_result treat dicts and MockResults
+    interchangeably, with unset optional fields reading as absent keys.
+    """
+    is_scam: str
+    confidence_level: float
+    scam_probability: float
+    explanation: str
+    processing_metadata: Dict[str, Any]
+    tool_evidence: Optional[list] = None
+    tool_errors: Optional[list] = None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return getattr(self, key, None) is not None
+
+_TEST_DIRS = (
+    "test/worker",
+    "test/worker/logs",
+    "test/worker/mock_data"
+)
+_ENV_READY = False
 
 def setup_test_environment():
-    """Setup test environment and ensure required directories exist."""
-    test_dirs = [
-        "test/worker",
-        "test/worker/logs",
-        "test/worker/mock_data"
-    ]
-    
-    for dir_path in test_dirs:
-        os.makedirs(dir_path, exist_ok=True)
-    
-    return test_dirs
+    """Setup test environment and ensure required directories exist.
 
-def create_mock_dependencies():
-    """Create a comprehensive set of mocked dependencies for testing."""
-    mocks = {
-        'call_tool': MagicMock(),
-        'chat_json': MagicMock(),
-        'process_document': MagicMock(),
-        'choose_tools': MagicMock(), 
-        'not_scam_executer': MagicMock(),
-        'scam_executer': MagicMock()
+    The directories survive for the life of the process, so after the
+    first successful call the makedirs syscalls are skipped entirely.
+    """
+    global _ENV_READY
+    if not _ENV_READY:
+        for dir_path in _TEST_DIRS:
+            os.makedirs(dir_path, exist_ok=True)
+        _ENV_READY = True
+
+    return _TEST_DIRS
+
+@functools.lru_cache(maxsize=None)
+def _mock_graph():
+    """Build the shared mock dependency graph once per process.
+
+    Plain Mock rather than MagicMock: none of the six callables is used
+    as an iterator, context manager, or numeric type, so there is no
+    reason to pay for the ~20 magic-method children MagicMock configures
+    on construction.
+    """
+    return {
+        'call_tool': Mock(),
+        'chat_json': Mock(),
+        'process_document': Mock(),
+        'choose_tools': Mock(),
+        'not_scam_executer': Mock(),
+        'scam_executer': Mock()
     }
-    
+
+def create_mock_dependencies():
+    """Return the mocked dependencies for testing, reset to a clean state.
+
+    Every test wants the same six-entry mock graph, so the mocks are
+    constructed once per process and handed back with call records and any
+    configured return_value/side_effect cleared, instead of paying the
+    construction cost again for each test. Reset-and-reuse is preferred
+    over cloning the graph with copy.copy: copied mocks share their
+    children and call records with the template, which would leak call
+    state between tests.
+    """
+    mocks = _mock_graph()
+    for mock in mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
     return mocks
 
-def setup_scam_detection_mocks(mocks: Dict[str, MagicMock], scenario: str = "high_confidence_scam"):
-    """Setup mocks for scam detection scenarios."""
-    if scenario == "high_confidence_scam":
-        mocks['process_document'].return_value = [
-            {"server": "data-processor", "tool": "extract_text", "args": {}}
-        ]
-        mocks['choose_tools'].return_value = [
-            {"server": "rag-tools", "tool": "call_rag", "args": {}}
-        ]
-        mocks['call_tool'].side_effect = [
-            "Suspicious content with Nigerian prince scam patterns",
-            {
-                "average_confidence_level": 0.95,
-                "average_scam_probability": 0.89,
-                "similar_documents": ["scam_1", "scam_2"],
-                "similarity_scores": [0.92, 0.88]
-            }
-        ]
-        mocks['scam_executer'].return_value = [
-            {"server": "gmail-tools", "tool": "classify_email", "args": {}}
-        ]
-    
-    elif scenario == "high_confidence_legitimate":
-        mocks['process_document'].return_value = [
-            {"server": "data-processor", "tool": "extract_text", "args": {}}
-        ]
-        mocks['choose_tools'].return_value = [
-            {"server": "rag-tools", "tool": "call_rag", "args": {}}
-        ]
-        mocks['call_tool'].side_effect = [
-            "Legitimate business communication content",
-            {
-                "average_confidence_level": 0.93,
-                "average_scam_probability": 0.11,
-                "similar_documents": ["business_1", "business_2"],
-                "similarity_scores": [0.90, 0.87]
-            }
-        ]
-        mocks['not_scam_executer'].return_value = [
-            {"server": "gmail-tools", "tool": "mark_safe", "args": {}}
-        ]
-    
-    elif scenario == "uncertain_case":
-        mocks['process_document'].return_value = [
-            {"server": "data-processor", "tool": "extract_text", "args": {}}
-        ]
-        mocks['choose_tools'].return_value = [
-            {"server": "rag-tools", "tool": "call_rag", "args": {}}
-        ]
-        mocks['call_tool'].side_effect = [
-            "Mixed content with both legitimate and suspicious elements",
-            {
-                "average_confidence_level": 0.65,
-                "average_scam_probability": 0.45,
-                "similar_documents": ["mixed_1"],
-                "similarity_scores": [0.68]
-            },
-            ["http://suspicious-link.com"],  # extract_link
-            ["555-0123", "$1000"]  # extract_number
-        ]
-        
-        # Mock LLM responses for uncertain case
-        mocks['chat_json'].side_effect = [
-            {  # Planner
-                "calls": [
-                    {"server": "extraction-tools", "tool": "extract_link", "args": {"text": "test"}},
-                    {"server": "extraction-tools", "tool": "extract_number", "args": {"text": "test"}}
-                ]
-            },
-            {  # Analyst
-                "is_scam": "suspicious",
-                "confidence_level": 0.7,
-                "scam_probability": 65.0,
-                "explanation": "Mixed indicators detected"
-            },
-            {  # Supervisor
-                "is_scam": "suspicious", 
-                "confidence_level": 0.7,
-                "scam_probability": 65.0,
-                "explanation": "Mixed indicators detected"
-            }
+# Static mock payloads, built once at import: scenario setup then assigns
+# references instead of re-allocating the nested literals on every test.
+# Tuples (and shared dicts the orchestrator only reads) are safe to share.
+_EXTRACT_TEXT_PLAN = ({"server": "data-processor", "tool": "extract_text", "args": {}},)
+_RAG_PLAN = ({"server": "rag-tools", "tool": "call_rag", "args": {}},)
+_SCAM_EXECUTE_PLAN = ({"server": "gmail-tools", "tool": "classify_email", "args": {}},)
+_NOT_SCAM_EXECUTE_PLAN = ({"server": "gmail-tools", "tool": "mark_safe", "args": {}},)
+
+_HIGH_CONF_SCAM_CALL_TOOL = (
+    "Suspicious content with Nigerian prince scam patterns",
+    {
+        "average_confidence_level": 0.95,
+        "average_scam_probability": 0.89,
+        "similar_documents": ["scam_1", "scam_2"],
+        "similarity_scores": [0.92, 0.88]
+    }
+)
+
+_HIGH_CONF_LEGIT_CALL_TOOL = (
+    "Legitimate business communication content",
+    {
+        "average_confidence_level": 0.93,
+        "average_scam_probability": 0.11,
+        "similar_documents": ["business_1", "business_2"],
+        "similarity_scores": [0.90, 0.87]
+    }
+)
+
+_UNCERTAIN_CALL_TOOL = (
+    "Mixed content with both legitimate and suspicious elements",
+    {
+        "average_confidence_level": 0.65,
+        "average_scam_probability": 0.45,
+        "similar_documents": ["mixed_1"],
+        "similarity_scores": [0.68]
+    },
+    ["http://suspicious-link.com"],  # extract_link
+    ["555-0123", "$1000"]  # extract_number
+)
+
+_UNCERTAIN_CHAT_JSON = (
+    {  # Planner
+        "calls": [
+            {"server": "extraction-tools", "tool": "extract_link", "args": {"text": "test"}},
+            {"server": "extraction-tools", "tool": "extract_number", "args": {"text": "test"}}
         ]
+    },
+    {  # Analyst
+        "is_scam": "suspicious",
+        "confidence_level": 0.7,
+        "scam_probability": 65.0,
+        "explanation": "Mixed indicators detected"
+    },
+    {  # Supervisor
+        "is_scam": "suspicious",
+        "confidence_level": 0.7,
+        "scam_probability": 65.0,
+        "explanation": "Mixed indicators detected"
+    }
+)
+
+_RAG_FAILURE_CALL_TOOL = (
+    "Extracted text content",  # extract_text succeeds
+    Exception("RAG service unavailable")  # call_rag fails
+)
+
+_EXTRACTION_FAILURE_CALL_TOOL = (
+    "Extracted text content",
+    {"average_confidence_level": 0.6, "average_scam_probability": 0.5},
+    Exception("Link extraction failed")  # Optional tool fails
+)
+
+_LLM_FAILURE_CALL_TOOL = (
+    "Extracted text",
+    {"average_confidence_level": 0.6, "average_scam_probability": 0.5}
+)
+
+# Scenario dispatch tables: configuring a scenario is one hash lookup and
+# a few setattrs instead of a string-compare chain, and adding a scenario
+# is a new row rather than a new branch
+_DETECTION_SCENARIOS = {
+    "high_confidence_scam": (
+        ("process_document", "return_value", _EXTRACT_TEXT_PLAN),
+        ("choose_tools", "return_value", _RAG_PLAN),
+        ("call_tool", "side_effect", _HIGH_CONF_SCAM_CALL_TOOL),
+        ("scam_executer", "return_value", _SCAM_EXECUTE_PLAN),
+    ),
+    "high_confidence_legitimate": (
+        ("process_document", "return_value", _EXTRACT_TEXT_PLAN),
+        ("choose_tools", "return_value", _RAG_PLAN),
+        ("call_tool", "side_effect", _HIGH_CONF_LEGIT_CALL_TOOL),
+        ("not_scam_executer", "return_value", _NOT_SCAM_EXECUTE_PLAN),
+    ),
+    "uncertain_case": (
+        ("process_document", "return_value", _EXTRACT_TEXT_PLAN),
+        ("choose_tools", "return_value", _RAG_PLAN),
+        ("call_tool", "side_effect", _UNCERTAIN_CALL_TOOL),
+        ("chat_json", "side_effect", _UNCERTAIN_CHAT_JSON),
+    ),
+}
+
+_ERROR_SCENARIOS = {
+    "rag_failure": (
+        ("call_tool", "side_effect", _RAG_FAILURE_CALL_TOOL),
+    ),
+    "extraction_failure": (
+        ("call_tool", "side_effect", _EXTRACTION_FAILURE_CALL_TOOL),
+    ),
+    "llm_failure": (
+        ("call_tool", "side_effect", _LLM_FAILURE_CALL_TOOL),
+        ("chat_json", "side_effect", Exception("LLM service unavailable")),
+    ),
+}
+
+def setup_scam_detection_mocks(mocks: Dict[str, Mock], scenario: str = "high_confidence_scam"):
+    """Setup mocks for scam detection scenarios."""
+    for name, attr, value in _DETECTION_SCENARIOS.get(scenario, ()):
+        setattr(mocks[name], attr, value)
+
+def _sequenced(results):
+    """Build a side_effect callable that replays results, raising exceptions.
+
+    Mock invokes a callable side_effect directly, bypassing its internal
+    sequence machinery (iterator wrapping plus per-call exception-type
+    checks on every element). Each call here gets a fresh closure, so the
+    shared payload tuples are never consumed across tests.
+    """
+    iterator = iter(results)
+
+    def side_effect(*args, **kwargs):
+        value = next(iterator)
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    return side_effect
 
-def setup_error_scenario_mocks(mocks: Dict[str, MagicMock], error_type: str = "rag_failure"):
+def setup_error_scenario_mocks(mocks: Dict[str, Mock], error_type: str = "rag_failure"):
     """Setup mocks to simulate various error scenarios."""
-    mocks['process_document'].return_value = [
-        {"server": "data-processor", "tool": "extract_text", "args": {}}
-    ]
-    mocks['choose_tools'].return_value = [
-        {"server": "rag-tools", "tool": "call_rag", "args": {}}
-    ]
-    
-    if error_type == "rag_failure":
-        mocks['call_tool'].side_effect = [
-            "Extracted text content",  # extract_text succeeds
-            Exception("RAG service unavailable")  # call_rag fails
-        ]
-    elif error_type == "extraction_failure":
-        mocks['call_tool'].side_effect = [
-            "Extracted text content",
-            {"average_confidence_level": 0.6, "average_scam_probability": 0.5},
-            Exception("Link extraction failed")  # Optional tool fails
-        ]
-    elif error_type == "llm_failure":
-        mocks['call_tool'].side_effect = [
-            "Extracted text",
-            {"average_confidence_level": 0.6, "average_scam_probability": 0.5}
-        ]
-        mocks['chat_json'].side_effect = Exception("LLM service unavailable")
+    mocks['process_document'].return_value = _EXTRACT_TEXT_PLAN
+    mocks['choose_tools'].return_value = _RAG_PLAN
+
+    for name, attr, value in _ERROR_SCENARIOS.get(error_type, ()):
+        if attr == "side_effect" and isinstance(value, tuple):
+            value = _sequenced(value)
+        setattr(mocks[name], attr, value)
+
+# Validation field sets, built once at module scope: tuple iteration skips
+# the per-call list allocation and the frozenset turns the is_scam
+# membership test into a hash lookup
+_REQUIRED_FIELDS = ("is_scam", "confidence_level", "scam_probability", "explanation")
+_METADATA_FIELDS = ("workflow_id", "total_time", "evidence_gathered", "errors_encountered")
+_VALID_IS_SCAM = frozenset(("scam", "not_scam", "suspicious"))
+
+# Structural validation of assessment results. With pydantic installed the
+# field, enum, and range rules compile once into its core validator, so a
+# check is a single C-level call instead of a dozen Python-level lookups
+# and comparisons; the stdlib fallback enforces the same rules by hand.
+if BaseModel is not None:
+    class _ResultSchema(BaseModel):
+        model_config = ConfigDict(from_attributes=True, extra="allow")
+
+        is_scam: str = Field(pattern=r"^(scam|not_scam|suspicious)$")
+        confidence_level: float = Field(ge=0, le=1)
+        scam_probability: float = Field(ge=0, le=100)
+        explanation: str
+        processing_metadata: Dict[str, Any]
+
+    def _structural_errors(result) -> List[str]:
+        try:
+            _ResultSchema.model_validate(result)
+            return []
+        except ValidationError as exc:
+            return [f"{'.'.join(str(loc) for loc in e['loc']) or 'result'}: {e['msg']}"
+                    for e in exc.errors()]
+else:
+    def _structural_errors(result) -> List[str]:
+        errors = []
+
+        # Required fields
+        for field in _REQUIRED_FIELDS:
+            if field not in result:
+                errors.append(f"Missing required field: {field}")
+
+        if "processing_metadata" not in result:
+            errors.append("Missing processing_metadata")
+
+        # Value validations
+        if "confidence_level" in result:
+            if not isinstance(result["confidence_level"], (int, float)) or not (0 <= result["confidence_level"] <= 1):
+                errors.append("confidence_level must be a number between 0 and 1")
+
+        if "scam_probability" in result:
+            scam_prob = result["scam_probability"]
+            if not isinstance(scam_prob, (int, float)) or not (0 <= scam_prob <= 100):
+                errors.append("scam_probability must be a number between 0 and 100")
+
+        if "is_scam" in result:
+            if result["is_scam"] not in _VALID_IS_SCAM:
+                errors.append(f"is_scam must be one of {sorted(_VALID_IS_SCAM)}")
+
+        return errors
 
 def validate_assessment_result(result: Dict[str, Any], expected_type: str = "any") -> List[str]:
     """Validate that an assessment result has the expected structure and values."""
-    errors = []
-    
-    # Required fields
-    required_fields = ["is_scam", "confidence_level", "scam_probability", "explanation"]
-    for field in required_fields:
-        if field not in result:
-            errors.append(f"Missing required field: {field}")
-    
-    # Processing metadata
-    if "processing_metadata" not in result:
-        errors.append("Missing processing_metadata")
-    else:
+    errors = _structural_errors(result)
+
+    # Metadata field presence (the metadata dict stays open-ended, so this
+    # check is the same on both validation paths)
+    if "processing_metadata" in result:
         metadata = result["processing_metadata"]
-        metadata_fields = ["workflow_id", "total_time", "evidence_gathered", "errors_encountered"]
-        for field in metadata_fields:
+        for field in _METADATA_FIELDS:
             if field not in metadata:
                 errors.append(f"Missing metadata field: {field}")
-    
-    # Value validations
-    if "confidence_level" in result:
-        if not isinstance(result["confidence_level"], (int, float)) or not (0 <= result["confidence_level"] <= 1):
-            errors.append("confidence_level must be a number between 0 and 1")
-    
-    if "scam_probability" in result:
-        scam_prob = result["scam_probability"]
-        if not isinstance(scam_prob, (int, float)) or not (0 <= scam_prob <= 100):
-            errors.append("scam_probability must be a number between 0 and 100")
-    
-    if "is_scam" in result:
-        valid_values = ["scam", "not_scam", "suspicious"]
-        if result["is_scam"] not in valid_values:
-            errors.append(f"is_scam must be one of {valid_values}")
-    
+
     # Type-specific validations
     if expected_type == "high_confidence_scam":
         if result.get("is_scam") != "scam":
@@ -207,66 +351,96 @@ def check_log_files_created(test_dir: str = "test/worker") -> Dict[str, bool]:
     }
     
     try:
-        files = os.listdir(test_dir)
-        log_files = [f for f in files if f.startswith("assessment_") and f.endswith(".log")]
-        json_files = [f for f in files if f.startswith("assessment_") and f.endswith(".json")]
-        
+        # One scandir pass: DirEntry caches is_file() from the readdir
+        # syscall, so no per-entry stat and no second directory walk
+        log_files = []
+        json_files = []
+        with os.scandir(test_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("assessment_") and entry.is_file()):
+                    continue
+                if name.endswith(".log"):
+                    log_files.append(entry.path)
+                elif name.endswith(".json"):
+                    json_files.append(entry.path)
+
         results["log_file_created"] = len(log_files) > 0
         results["json_file_created"] = len(json_files) > 0
-        
-        # Test if files are readable
+
+        # Non-emptiness needs only the size from a stat call, not the file
+        # contents: > 0 for the log, > 2 for the JSON so a bare "{}" file
+        # still counts as empty. Callers that want the parsed JSON use
+        # load_assessment_json instead.
         if log_files and json_files:
             try:
-                # Read log file
-                with open(os.path.join(test_dir, log_files[0]), 'r') as f:
-                    log_content = f.read()
-                
-                # Read JSON file
-                with open(os.path.join(test_dir, json_files[0]), 'r') as f:
-                    json_content = json.load(f)
-                
-                results["files_readable"] = len(log_content) > 0 and len(json_content) > 0
+                results["files_readable"] = (os.path.getsize(log_files[0]) > 0
+                                             and os.path.getsize(json_files[0]) > 2)
             except Exception:
                 results["files_readable"] = False
-    
+
     except Exception:
         pass
-    
+
     return results
 
-def measure_performance(func, *args, **kwargs) -> Dict[str, Any]:
-    """Measure performance metrics for a function call."""
-    start_time = time.time()
-    start_memory = 0  # Could implement memory measurement if needed
-    
-    try:
-        result = func(*args, **kwargs)
-        success = True
-        error = None
-    except Exception as e:
-        result = None
-        success = False
-        error = str(e)
-    
-    end_time = time.time()
-    
-    performance_data = {
-        "execution_time": end_time - start_time,
-        "success": success,
-        "error": error,
-        "result": result
-    }
-    
-    return performance_data
+def load_assessment_json(json_path: str) -> Dict[str, Any]:
+    """Parse an assessment JSON file written by the logger.
 
-def create_test_document(doc_type: str = "email", content_type: str = "neutral") -> Dict[str, Any]:
-    """Create test documents with specific characteristics."""
+    Uses orjson's C parser when installed (reads bytes directly, no
+    decode step); stdlib json otherwise, matching how the suite treats
+    its other optional dependencies.
+    """
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(json_path, 'r') as f:
+        return json.load(f)
+
+# Lightweight measurement record: cheaper to build and smaller than the
+# dict it replaces, with attribute access on the consuming side
+PerfResult = namedtuple(
+    "PerfResult",
+    ("execution_time", "duration_ns", "rounds", "success", "error", "result"))
+
+
+def measure_performance(func, *args, rounds: int = 1, **kwargs) -> PerfResult:
+    """Measure performance metrics for a function call.
+
+    Timed with the monotonic perf_counter_ns clock, which has nanosecond
+    resolution and is immune to wall-clock (NTP) adjustments. With
+    rounds > 1 the call is repeated and the median duration reported,
+    which damps single-shot timing noise; measurement stops early if a
+    round raises.
+    """
+    durations = []
+    result = None
+    success = True
+    error = None
+
+    for _ in range(max(1, rounds)):
+        start_ns = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            result = None
+            success = False
+            error = str(e)
+        durations.append(time.perf_counter_ns() - start_ns)
+        if not success:
+            break
+
+    dur_ns = int(statistics.median(durations))
+    return PerfResult(dur_ns / 1e9, dur_ns, len(durations), success, error, result)
+
+@functools.lru_cache(maxsize=16)
+def _document_template(doc_type: str, content_type: str):
+    """Immutable base document for a (type, scenario) pair, built once."""
     base_document = {
         "type": doc_type,
-        "timestamp": time.time(),
         "test_scenario": content_type
     }
-    
+
     if content_type == "scam":
         base_document.update({
             "subject": "URGENT: Claim Your Inheritance",
@@ -291,20 +465,32 @@ def create_test_document(doc_type: str = "email", content_type: str = "neutral")
             "from": "test@example.com",
             "content": "This is a test document for assessment."
         })
-    
-    return base_document
+
+    return MappingProxyType(base_document)
+
+def create_test_document(doc_type: str = "email", content_type: str = "neutral") -> Dict[str, Any]:
+    """Create test documents with specific characteristics.
+
+    Only the timestamp varies between calls, so the static fields come
+    from a cached immutable template and each call just copies it and
+    stamps the time.
+    """
+    document = dict(_document_template(doc_type, content_type))
+    document["timestamp"] = time.time()
+    return document
 
 def cleanup_test_files(test_dir: str = "test/worker", pattern: str = "assessment_"):
-    """Clean up test files created during testing."""
+    """Clean up test files created during testing.
+
+    Path.glob pushes the prefix match down to the OS-level matcher, and
+    unlink(missing_ok=True) drops the separate is-file stat along with
+    the race between checking and deleting.
+    """
     try:
-        files = os.listdir(test_dir)
-        test_files = [f for f in files if f.startswith(pattern)]
-        
-        for file in test_files:
-            file_path = os.path.join(test_dir, file)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
-        
-        return len(test_files)
+        count = 0
+        for file_path in Path(test_dir).glob(f"{pattern}*"):
+            file_path.unlink(missing_ok=True)
+            count += 1
+        return count
     except Exception:
         return 0